@@ -158,6 +158,16 @@ def _handle_tool_error(
 # ---------------------------------------------------------------------------
 
 
+def _build_openai_client(api_key: str | None) -> Any:
+    """OpenAI client for the orchestrator; falls back to OPENAI_API_KEY when no key is passed."""
+    try:
+        import openai
+    except ImportError as exc:
+        raise RuntimeError("openai package not installed. Run: pip install openai") from exc
+
+    return openai.OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"), max_retries=5)
+
+
 def _run_loop(
     task: str,
     env: str,
@@ -168,12 +178,7 @@ def _run_loop(
     api_key: str | None,
 ) -> dict[str, Any]:
     """Core agentic loop. Returns result dict with score, status, output paths."""
-    try:
-        import openai
-    except ImportError as exc:
-        raise RuntimeError("openai package not installed. Run: pip install openai") from exc
-
-    client = openai.OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"), max_retries=5)
+    client = _build_openai_client(api_key)
 
     # --- Memory: load prior assessments for this org ---
     mem_client = None
@@ -20,7 +20,8 @@ def _load_yaml(path: Path) -> dict[str, Any]:
         import yaml  # type: ignore
     except ModuleNotFoundError as exc:
         raise RuntimeError("PyYAML is required. Install with: pip install PyYAML") from exc
-    data = yaml.safe_load(path.read_text())
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(path.read_text(), Loader=loader)
     if not isinstance(data, dict):
         raise ValueError(f"Expected YAML object at {path}")
     return data
@@ -120,7 +121,7 @@ def _to_markdown(
     return "\n".join(lines)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Map gap-analysis findings to SBS controls.")
     parser.add_argument("--controls", required=True, help="Path to normalized SBS controls JSON.")
     parser.add_argument("--gap-analysis", required=True, help="Path to gap-analysis JSON.")
@@ -132,7 +133,7 @@ def main() -> int:
     )
     parser.add_argument("--out-md", required=True, help="Output markdown matrix path.")
     parser.add_argument("--out-json", required=True, help="Output JSON backlog path.")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     repo_root = Path(__file__).resolve().parents[1]
     controls_path = (repo_root / args.controls).resolve()
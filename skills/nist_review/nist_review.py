@@ -22,6 +22,11 @@ from typing import Any
 import click
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _REPO = Path(__file__).resolve().parents[2]
 load_dotenv(_REPO / ".env")
 
@@ -147,8 +152,10 @@ def _load_json(path: str | Path) -> dict[str, Any]:
     if not p.exists():
         click.echo(f"ERROR: file not found: {p}", err=True)
         sys.exit(1)
+    raw = p.read_bytes()
     try:
-        return json.loads(p.read_text())
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except json.JSONDecodeError as exc:
         click.echo(f"ERROR: invalid JSON in {p}: {exc}", err=True)
         sys.exit(1)
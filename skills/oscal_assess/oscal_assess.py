@@ -1259,7 +1259,7 @@ def cli() -> None:
     show_default=True,
     help="Path to imported SBS controls catalog JSON.",
 )
-@click.option("--out", default=None, help="Output path for gap-analysis JSON (default: stdout).")
+@click.option("--out", default=None, help="Output path for gap-analysis JSON (default or '-': stdout).")
 @click.option(
     "--env",
     default="dev",
@@ -1373,7 +1373,7 @@ def assess(
     }
 
     output = json.dumps(payload, indent=2)
-    if out:
+    if out and out != "-":
         out_path = (repo_root / out).resolve()
         out_path.parent.mkdir(parents=True, exist_ok=True)
         out_path.write_text(output)
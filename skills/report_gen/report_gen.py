@@ -26,13 +26,24 @@ import json
 import os
 import subprocess
 import sys
+import threading
+import zipfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from copy import deepcopy
 from datetime import UTC, datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 import click
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _REPO = Path(__file__).resolve().parents[2]
 load_dotenv(_REPO / ".env")
 
@@ -44,6 +55,8 @@ _SEV_ORDER = {"critical": 0, "high": 1, "moderate": 2, "low": 3}
 _STA_ORDER = {"fail": 0, "partial": 1, "pass": 2, "not_applicable": 3}
 _SEV_ICON = {"critical": "🔴", "high": "🟠", "moderate": "🟡", "low": "🔵"}
 _STA_ICON = {"fail": "❌", "partial": "⚠️", "pass": "✅", "not_applicable": "—"}
+# Interned severity/status vocabulary — lookups on these values hit the identity fast path
+_INTERN = {s: sys.intern(s) for s in (*_SEV_ORDER, *_STA_ORDER)}
 
 # ---------------------------------------------------------------------------
 # System prompts — LLM writes narrative only; all tables injected by harness
@@ -82,22 +95,73 @@ def _load_json(path: str | Path) -> dict[str, Any]:
     if not p.exists():
         click.echo(f"ERROR: file not found: {p}", err=True)
         sys.exit(1)
+    raw = p.read_bytes()
     try:
-        return json.loads(p.read_text())
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except json.JSONDecodeError as exc:
         click.echo(f"ERROR: invalid JSON in {p}: {exc}", err=True)
         sys.exit(1)
 
 
 def _sorted_findings(items: list[dict]) -> list[dict]:
-    """Sort findings: fail before partial before pass, critical before high before moderate."""
-    return sorted(
-        items,
-        key=lambda x: (
-            _STA_ORDER.get(x.get("status", ""), 9),
-            _SEV_ORDER.get(x.get("severity", ""), 9),
-        ),
-    )
+    """Sort findings: fail before partial before pass, critical before high before moderate.
+
+    Stable bucket sort: one pass groups items by (status, severity) rank, then only the
+    handful of distinct rank keys are sorted — input order is preserved within a bucket.
+    """
+    buckets: dict[tuple[int, int], list[dict]] = {}
+    for item in items:
+        rank = (_STA_ORDER.get(item.get("status", ""), 9), _SEV_ORDER.get(item.get("severity", ""), 9))
+        buckets.setdefault(rank, []).append(item)
+    return [item for rank in sorted(buckets) for item in buckets[rank]]
+
+
+def _open_findings(items: list[dict]) -> list[dict]:
+    """Sorted fail/partial findings — rendered by both the Immediate Actions and POA&M sections."""
+    return _sorted_findings([i for i in items if i.get("status") in ("fail", "partial")])
+
+
+def _md_row(cells: Iterable[Any]) -> str:
+    """Markdown table row; pipes are escaped only in the (rare) cells that contain one."""
+    return "| " + " | ".join(c.replace("|", "\\|") if "|" in c else c for c in map(str, cells)) + " |"
+
+
+def _md_row_fast(cells: Iterable[Any]) -> str:
+    """Markdown table row for harness-controlled values (counts, icons, fixed labels) — no escaping."""
+    return "| " + " | ".join(map(str, cells)) + " |"
+
+
+def _prepare_items(items: list[dict]) -> None:
+    """Attach pre-rendered display strings to each finding, once per run.
+
+    Priority, POA&M, and full-matrix tables all render the same findings; baking the
+    icon + label strings and column defaults here keeps the per-row table loops free of
+    repeat formatting and .get() fallback chains. Known severity/status values are
+    swapped for their interned copies so later dict lookups and comparisons are cheap.
+    """
+    for item in items:
+        sev = item.get("severity", "?")
+        sta = item.get("status", "?")
+        if sev in _INTERN:
+            sev = item["severity"] = _INTERN[sev]
+        if sta in _INTERN:
+            sta = item["status"] = _INTERN[sta]
+        item["_sev_display"] = f"{_SEV_ICON.get(sev, '')} {sev.capitalize()}"
+        item["_sta_display"] = f"{_STA_ICON.get(sta, '')} {sta.capitalize()}"
+        item["_cid_display"] = f"`{item.get('sbs_control_id', '?')}`"
+        item["_desc_display"] = item.get("sbs_title", "—")
+        item["_conf_display"] = item.get("mapping_confidence", "—")
+        item["_due_display"] = item.get("due_date") or "—"
+        item["_owner_display"] = item.get("owner", "—")
+
+
+# Column projections over _prepare_items output (C-level tuple extraction per row)
+_MATRIX_ROW = itemgetter(
+    "_cid_display", "_desc_display", "_sev_display", "_sta_display", "_conf_display", "_due_display", "_owner_display"
+)
+_PRIORITY_COLS = itemgetter("_cid_display", "_desc_display", "_sev_display", "_sta_display")
+_POAM_COLS = itemgetter("_cid_display", "_desc_display", "_sev_display", "_owner_display", "_due_display")
 
 
 def _build_user_message(
@@ -107,15 +171,17 @@ def _build_user_message(
     audience: str,
     org: str,
     title: str,
+    generated_at: datetime | None = None,
 ) -> str:
     """Minimal context for the LLM — enough for narrative, no duplication of pre-rendered tables."""
+    generated_at = generated_at or datetime.now(UTC)
     all_items = backlog.get("mapped_items", [])
     assessed = [i for i in all_items if i.get("status") not in ("not_applicable",)]
 
     lines = [
         f"Assessment Title: {title}",
         f"Org: {org}",
-        f"Generated: {datetime.now(UTC).isoformat()}",
+        f"Generated: {generated_at.isoformat()}",
         f"Assessment ID: {backlog.get('assessment_id', 'unknown')}",
         f"Total controls assessed: {len(assessed)} of {len(all_items)}",
     ]
@@ -146,12 +212,11 @@ def _build_user_message(
             )
 
     if nist:
-        review = nist.get("nist_ai_rmf_review", nist)
-        overall = review.get("overall", "unknown")
+        overall = nist.get("overall", "unknown")
         lines.append(
             f"\nNIST AI RMF context: overall={overall} "
-            f"(govern={review.get('govern', {}).get('status', '?')}, "
-            f"manage={review.get('manage', {}).get('status', '?')})"
+            f"(govern={nist.get('govern', {}).get('status', '?')}, "
+            f"manage={nist.get('manage', {}).get('status', '?')})"
         )
 
     lines.append(
@@ -284,13 +349,16 @@ def _render_oscal_provenance(backlog: dict, platform: str | None = None) -> str:
         "|-------|----------|---------|-------|-------------|",
     ]
     for row in chain:
-        lines.append(f"| {row['layer']} | {row['document']} | {row['version']} | {row['scope']} | {row['file']} |")
+        lines.append(_md_row_fast((row["layer"], row["document"], row["version"], row["scope"], row["file"])))
     lines.append("")
     return "\n".join(lines)
 
 
-def _render_executive_scorecard(backlog: dict, sscf: dict | None, org: str, title: str) -> str:
+def _render_executive_scorecard(
+    backlog: dict, sscf: dict | None, org: str, title: str, generated_at: datetime | None = None
+) -> str:
     """Overall score badge + severity × status matrix."""
+    generated_at = generated_at or datetime.now(UTC)
     items = backlog.get("mapped_items", [])
     assessed = [i for i in items if i.get("status") != "not_applicable"]
 
@@ -314,7 +382,7 @@ def _render_executive_scorecard(backlog: dict, sscf: dict | None, org: str, titl
         f"# {title}",
         "",
         f"**Org:** {org} &nbsp;|&nbsp; "
-        f"**Generated:** {datetime.now(UTC).strftime('%Y-%m-%d')} &nbsp;|&nbsp; "
+        f"**Generated:** {generated_at.strftime('%Y-%m-%d')} &nbsp;|&nbsp; "
         f"**Assessment ID:** {backlog.get('assessment_id', 'unknown')}",
         "",
         "---",
@@ -331,10 +399,9 @@ def _render_executive_scorecard(backlog: dict, sscf: dict | None, org: str, titl
         if any(row.values()):
             icon = _SEV_ICON.get(sev, "")
             lines.append(
-                f"| {icon} **{sev.capitalize()}** "
-                f"| {row['fail'] or '—'} "
-                f"| {row['partial'] or '—'} "
-                f"| {row['pass'] or '—'} |"
+                _md_row_fast(
+                    (f"{icon} **{sev.capitalize()}**", row["fail"] or "—", row["partial"] or "—", row["pass"] or "—")
+                )
             )
     lines += [
         "",
@@ -383,11 +450,9 @@ def _render_domain_chart(sscf: dict) -> str:
     return "\n".join(lines)
 
 
-def _render_priority_findings(backlog: dict, n: int = 10) -> str:
+def _render_priority_findings(open_items: list[dict], n: int = 10) -> str:
     """Top-N findings sorted critical/fail first."""
-    items = backlog.get("mapped_items", [])
-    actionable = [i for i in items if i.get("status") in ("fail", "partial")]
-    sorted_items = _sorted_findings(actionable)[:n]
+    sorted_items = open_items[:n]
 
     if not sorted_items:
         return ""
@@ -399,33 +464,21 @@ def _render_priority_findings(backlog: dict, n: int = 10) -> str:
         "|---|---------|-------------|----------|--------|----------------|----------|",
     ]
     for idx, item in enumerate(sorted_items, 1):
-        cid = item.get("sbs_control_id", "?")
-        desc = item.get("sbs_title", "—")
-        sev = item.get("severity", "?")
-        sta = item.get("status", "?")
-        sev_icon = _SEV_ICON.get(sev, "")
-        sta_icon = _STA_ICON.get(sta, "")
         action = item.get("remediation") or item.get("sbs_title") or "See control catalog"
         action = action[:70] + "…" if len(action) > 70 else action
-        due = item.get("due_date") or "—"
-        sev_str = f"{sev_icon} {sev.capitalize()}"
-        sta_str = f"{sta_icon} {sta.capitalize()}"
-        lines.append(f"| {idx} | `{cid}` | {desc} | {sev_str} | {sta_str} | {action} | {due} |")
+        lines.append(_md_row((idx, *_PRIORITY_COLS(item), action, item["_due_display"])))
 
     lines.append("")
     return "\n".join(lines)
 
 
-def _render_poam(backlog: dict) -> str:
+def _render_poam(backlog: dict, open_items: list[dict], generated_at: datetime | None = None) -> str:
     """Formal Plan of Action & Milestones table — open (fail) and in-progress (partial) findings only."""
-    items = backlog.get("mapped_items", [])
-    open_items = _sorted_findings([i for i in items if i.get("status") in ("fail", "partial")])
-
     if not open_items:
         return "## Plan of Action & Milestones (POA&M)\n\n*No open items — all assessed controls passed.*\n"
 
     assessment_id = backlog.get("assessment_id", "unknown")
-    generated = backlog.get("generated_at_utc", datetime.now(UTC).isoformat())[:10]
+    generated = (backlog.get("generated_at_utc") or (generated_at or datetime.now(UTC)).isoformat())[:10]
 
     lines = [
         "## Plan of Action & Milestones (POA&M)",
@@ -439,20 +492,10 @@ def _render_poam(backlog: dict) -> str:
     ]
     for idx, item in enumerate(open_items, 1):
         poam_id = f"POAM-{idx:03d}"
-        cid = item.get("sbs_control_id", "?")
-        desc = item.get("sbs_title", "—")
-        sev = item.get("severity", "?")
-        sta = item.get("status", "?")
-        owner = item.get("owner", "—")
-        due = item.get("due_date") or "—"
         milestone = item.get("remediation") or "Remediate per control guidance"
         milestone = milestone[:80] + "…" if len(milestone) > 80 else milestone
-        sev_icon = _SEV_ICON.get(sev, "")
-        open_status = "Open" if sta == "fail" else "In Progress"
-        lines.append(
-            f"| `{poam_id}` | `{cid}` | {desc} | {sev_icon} {sev.capitalize()} "
-            f"| {owner} | {due} | {milestone} | {open_status} |"
-        )
+        open_status = "Open" if item.get("status") == "fail" else "In Progress"
+        lines.append(_md_row((f"`{poam_id}`", *_POAM_COLS(item), milestone, open_status)))
 
     lines.append("")
     return "\n".join(lines)
@@ -480,48 +523,38 @@ def _render_not_assessed(backlog: dict) -> str:
         cid = item.get("sbs_control_id", "?")
         desc = item.get("sbs_title", "—")
         notes = item.get("mapping_notes", "Outside automated collector scope")
-        lines.append(f"| `{cid}` | {desc} | {notes} |")
+        lines.append(_md_row((f"`{cid}`", desc, notes)))
     for item in unmapped:
         cid = item.get("legacy_control_id", "?")
-        lines.append(f"| `{cid}` | — | No catalog mapping — manual review required |")
+        lines.append(_md_row((f"`{cid}`", "—", "No catalog mapping — manual review required")))
 
     lines.append("")
     return "\n".join(lines)
 
 
-def _render_full_matrix(backlog: dict) -> str:
-    """Complete sorted findings table — critical/fail first."""
-    items = backlog.get("mapped_items", [])
-    sorted_items = _sorted_findings(items)
-
-    lines = [
-        "## Full Control Matrix",
-        "",
-        "| Control | Description | Severity | Status | Confidence | Due Date | Owner |",
-        "|---------|-------------|----------|--------|------------|----------|-------|",
-    ]
-    for item in sorted_items:
-        cid = item.get("sbs_control_id", "?")
-        desc = item.get("sbs_title", "—")
-        sev = item.get("severity", "?")
-        sta = item.get("status", "?")
-        sev_icon = _SEV_ICON.get(sev, "")
-        sta_icon = _STA_ICON.get(sta, "")
-        conf = item.get("mapping_confidence", "—")
-        due = item.get("due_date") or "—"
-        owner = item.get("owner", "—")
-        sev_str = f"{sev_icon} {sev.capitalize()}"
-        sta_str = f"{sta_icon} {sta.capitalize()}"
-        lines.append(f"| `{cid}` | {desc} | {sev_str} | {sta_str} | {conf} | {due} | {owner} |")
+def _render_full_matrix(prepared_items: list[dict]) -> Iterator[str]:
+    """Complete sorted findings table — critical/fail first.
 
-    lines.append("")
-    return "\n".join(lines)
+    Takes mapped_items after _prepare_items has attached their display strings. This is
+    the one section that grows with the catalog, so rows are yielded lazily and streamed
+    by _write_markdown instead of being joined into a string. Yields nothing when empty.
+    """
+    if not prepared_items:
+        return
+    yield "## Full Control Matrix"
+    yield ""
+    yield "| Control | Description | Severity | Status | Confidence | Due Date | Owner |"
+    yield "|---------|-------------|----------|--------|------------|----------|-------|"
+    for item in _sorted_findings(prepared_items):
+        yield _md_row(_MATRIX_ROW(item))
+    yield ""
 
 
 # ---------------------------------------------------------------------------
 # NIST section renderer
 # ---------------------------------------------------------------------------
 
+_NIST_FUNCTIONS = ("govern", "map", "measure", "manage")
 _NIST_STATUS_ICON = {"pass": "✅", "partial": "⚠️", "fail": "❌"}
 _NIST_OVERALL_ICON = {"block": "⛔", "flag": "🚩", "pass": "✅"}
 _NIST_GATE_BANNERS = {
@@ -551,8 +584,14 @@ _NIST_APPOWNER_NOTE = {
 }
 
 
-def _render_nist_section(nist: dict[str, Any]) -> str:
+def _normalize_nist(nist: dict[str, Any]) -> dict[str, Any]:
+    """Unwrap the nist_ai_rmf_review envelope and lower-case its keys so renderers need a single lookup."""
     review = nist.get("nist_ai_rmf_review", nist)
+    return {str(k).lower(): v for k, v in review.items()}
+
+
+def _render_nist_section(review: dict[str, Any]) -> str:
+    """Render the NIST AI RMF section from a review already passed through _normalize_nist."""
     overall = review.get("overall", "unknown").lower()
     overall_icon = _NIST_OVERALL_ICON.get(overall, "ℹ️")
     reviewed_at = review.get("reviewed_at_utc", "unknown")
@@ -568,12 +607,12 @@ def _render_nist_section(nist: dict[str, Any]) -> str:
         "| Function | Status | Notes |",
         "|---|---|---|",
     ]
-    for fn in ["govern", "map", "measure", "manage"]:
+    for fn in _NIST_FUNCTIONS:
         data = review.get(fn, {})
         status = data.get("status", "unknown")
         icon = _NIST_STATUS_ICON.get(status, "—")
         notes = data.get("notes", "—")
-        lines.append(f"| **{fn.upper()}** | {icon} {status.upper()} | {notes} |")
+        lines.append(_md_row((f"**{fn.upper()}**", f"{icon} {status.upper()}", notes)))
 
     blocking = review.get("blocking_issues", [])
     if blocking:
@@ -639,41 +678,162 @@ def _call_llm(system_prompt: str, user_msg: str, model: str, mock: bool = False)
     return response.choices[0].message.content.strip()
 
 
-def _apply_table_borders(docx_path: Path) -> None:
-    """Post-process DOCX: apply full single-line borders to every table cell."""
-    try:
-        from copy import deepcopy
+def _start_llm(system_prompt: str, user_msg: str, model: str, mock: bool = False) -> Future[str]:
+    """Run _call_llm on a daemon thread so the harness can render while the request is in flight.
 
-        from docx import Document
-        from docx.oxml.ns import qn
+    A daemon thread rather than an executor: if rendering raises, generate exits straight
+    away instead of waiting on the LLM response. Exceptions (including _call_llm's
+    sys.exit) are re-raised by future.result().
+    """
+    future: Future[str] = Future()
+
+    def _run() -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(_call_llm(system_prompt, user_msg, model, mock))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=_run, name="report-gen-llm", daemon=True).start()
+    return future
+
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_TBL_PR_TAG = f"{{{_W_NS}}}tblPr"
+_TBL_BORDERS_TAG = f"{{{_W_NS}}}tblBorders"
+_TBL_BORDERS_XML = (
+    f'<w:tblBorders xmlns:w="{_W_NS}">'
+    '<w:top w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:left w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:bottom w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:right w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:insideH w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    '<w:insideV w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    "</w:tblBorders>"
+)
+# tblPr children that must follow tblBorders (ECMA-376 CT_TblPr element order)
+_TBL_BORDERS_SUCCESSORS = frozenset(
+    f"{{{_W_NS}}}{tag}"
+    for tag in ("shd", "tblLayout", "tblCellMar", "tblLook", "tblCaption", "tblDescription", "tblPrChange")
+)
+
+_DOCX_SYMS: dict[str, Any] = {}
+
+
+def _docx_syms() -> dict[str, Any]:
+    """Resolve the optional lxml / python-docx symbols once; empty dict if lxml is not installed."""
+    if _DOCX_SYMS:
+        return _DOCX_SYMS
+    try:
         from lxml import etree
     except ImportError:
-        return  # python-docx not installed; skip silently
-
-    _BORDER_XML = (
-        '<w:tcBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-        '<w:top w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
-        '<w:left w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
-        '<w:bottom w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
-        '<w:right w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
-        '<w:insideH w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
-        '<w:insideV w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
-        "</w:tcBorders>"
+        return _DOCX_SYMS
+    try:
+        from docx import Document
+    except ImportError:
+        Document = None  # noqa: N806 — fallback path only
+    _DOCX_SYMS.update(
+        etree=etree,
+        Document=Document,
+        border_proto=etree.fromstring(_TBL_BORDERS_XML),
     )
-    border_proto = etree.fromstring(_BORDER_XML)
+    return _DOCX_SYMS
+
 
-    doc = Document(docx_path)
+def _set_tbl_borders(tbl_pr: Any, border_proto: Any) -> None:
+    """Replace any tblBorders on a table's tblPr with a copy of border_proto, keeping CT_TblPr order."""
+    existing = tbl_pr.find(_TBL_BORDERS_TAG)
+    if existing is not None:
+        tbl_pr.remove(existing)
+    borders = deepcopy(border_proto)
+    successor = next((child for child in tbl_pr if child.tag in _TBL_BORDERS_SUCCESSORS), None)
+    if successor is not None:
+        successor.addprevious(borders)
+    else:
+        tbl_pr.append(borders)
+
+
+def _patch_document_xml(docx_path: Path, syms: dict[str, Any]) -> None:
+    """Add table borders by rewriting word/document.xml inside the DOCX zip.
+
+    Every other package part is copied through byte-for-byte, so python-docx never has
+    to load, reconcile, and re-serialize the whole package.
+    """
+    etree = syms["etree"]
+    with zipfile.ZipFile(docx_path) as src:
+        parts = [(info, src.read(info)) for info in src.infolist()]
+
+    patched = False
+    for idx, (info, data) in enumerate(parts):
+        if info.filename != "word/document.xml":
+            continue
+        root = etree.fromstring(data)
+        for tbl_pr in root.iter(_TBL_PR_TAG):
+            _set_tbl_borders(tbl_pr, syms["border_proto"])
+        parts[idx] = (info, etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True))
+        patched = True
+    if not patched:
+        raise KeyError("word/document.xml not found in DOCX package")
+
+    tmp_path = docx_path.with_name(docx_path.name + ".tmp")
+    try:
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as dst:
+            for info, data in parts:
+                dst.writestr(info, data)
+        tmp_path.replace(docx_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _apply_table_borders(docx_path: Path) -> None:
+    """Post-process DOCX: apply full single-line borders to every table.
+
+    Borders are set once per table (tblBorders incl. insideH/insideV) rather than on
+    every cell, so the cost scales with the number of tables, not cells. The document
+    part is patched directly; python-docx is only used as a fallback.
+    """
+    syms = _docx_syms()
+    if not syms:
+        return  # lxml not installed; skip silently
+    try:
+        _patch_document_xml(docx_path, syms)
+        return
+    except Exception as exc:
+        if syms["Document"] is None:
+            click.echo(f"WARNING: DOCX table borders not applied: {exc}", err=True)
+            return
+
+    doc = syms["Document"](docx_path)
     for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                tcp = cell._tc.get_or_add_tcPr()  # noqa: SLF001
-                existing = tcp.find(qn("w:tcBorders"))
-                if existing is not None:
-                    tcp.remove(existing)
-                tcp.append(deepcopy(border_proto))
+        _set_tbl_borders(table._tbl.tblPr, syms["border_proto"])  # noqa: SLF001
     doc.save(docx_path)
 
 
+def _write_markdown(out_path: Path, parts: list[str | Iterable[str]]) -> None:
+    """Stream report sections to disk rather than joining them into one document string first.
+
+    A section is either a rendered string or an iterable of lines (written newline-separated);
+    empty strings and iterables that yield nothing are skipped.
+    """
+    with out_path.open("w", encoding="utf-8") as fh:
+        write = fh.write
+        wrote_section = False
+        for part in parts:
+            if isinstance(part, str):
+                part = (part,) if part else ()
+            lines = iter(part)
+            first = next(lines, None)
+            if first is None:
+                continue  # empty section — no separator either
+            if wrote_section:
+                write("\n\n")
+            write(first)
+            for line in lines:
+                write("\n")
+                write(line)
+            wrote_section = True
+
+
 def _run_pandoc(md_path: Path, docx_path: Path) -> None:
     template = Path(__file__).parent / "report_template.docx"
     cmd = ["pandoc", str(md_path), "-o", str(docx_path)]
@@ -755,16 +915,19 @@ def generate(
             click.echo(f"report-gen [DRY-RUN]: would also write {out_path.with_suffix('.docx')}", err=True)
         return
 
+    now = datetime.now(UTC)
     backlog_data = _load_json(backlog)
     sscf_data = _load_json(sscf_benchmark) if sscf_benchmark else None
-    nist_data = _load_json(nist_review) if nist_review else None
+    nist_data = _normalize_nist(_load_json(nist_review)) if nist_review else None
+    mapped_items = backlog_data.get("mapped_items", [])
+    _prepare_items(mapped_items)
+    open_items = _open_findings(mapped_items)
 
     # ── NIST gate banner ─────────────────────────────────────────────────────
     banner = ""
     nist_section = ""
     if nist_data:
-        review = nist_data.get("nist_ai_rmf_review", nist_data)
-        overall = review.get("overall", "").lower()
+        overall = nist_data.get("overall", "").lower()
         if audience == "security":
             banner = _NIST_GATE_BANNERS.get(overall, "")
             nist_section = _render_nist_section(nist_data)
@@ -772,41 +935,38 @@ def generate(
         elif audience == "app-owner":
             banner = _NIST_APPOWNER_NOTE.get(overall, "")
 
+    # ── LLM narrative (runs in the background while the harness renders) ─────
+    system_prompt = _SYSTEM_PROMPTS[audience]
+    user_msg = _build_user_message(backlog_data, sscf_data, nist_data, audience, org, report_title, now)
+    narrative_future = _start_llm(system_prompt, user_msg, model, mock_llm)
+
     # ── Python-rendered structural sections ──────────────────────────────────
-    scorecard = _render_executive_scorecard(backlog_data, sscf_data, org, report_title)
+    scorecard = _render_executive_scorecard(backlog_data, sscf_data, org, report_title, now)
     provenance = _render_oscal_provenance(backlog_data, platform)
     domain_chart = _render_domain_chart(sscf_data) if sscf_data else ""
-    priority = _render_priority_findings(backlog_data)
-    full_matrix = _render_full_matrix(backlog_data)
-    poam = _render_poam(backlog_data) if audience == "security" else ""
+    priority = _render_priority_findings(open_items)
+    full_matrix = _render_full_matrix(mapped_items)
+    poam = _render_poam(backlog_data, open_items, now) if audience == "security" else ""
     not_assessed = _render_not_assessed(backlog_data) if audience == "security" else ""
 
-    # ── LLM narrative ────────────────────────────────────────────────────────
-    system_prompt = _SYSTEM_PROMPTS[audience]
-    user_msg = _build_user_message(backlog_data, sscf_data, nist_data, audience, org, report_title)
-    llm_narrative = _call_llm(system_prompt, user_msg, model, mock=mock_llm)
+    llm_narrative = narrative_future.result()
 
     # ── Assemble document ────────────────────────────────────────────────────
     parts = [
-        p
-        for p in [
-            banner,
-            scorecard,
-            provenance,
-            domain_chart,
-            priority,
-            llm_narrative,
-            full_matrix,
-            poam,
-            not_assessed,
-            nist_section,
-        ]
-        if p
+        banner,
+        scorecard,
+        provenance,
+        domain_chart,
+        priority,
+        llm_narrative,
+        full_matrix,
+        poam,
+        not_assessed,
+        nist_section,
     ]
-    markdown = "\n\n".join(parts)
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(markdown)
+    _write_markdown(out_path, parts)
     click.echo(f"report-gen: wrote {out_path}", err=True)
 
     if audience == "security":
@@ -6,18 +6,31 @@ Read-only. Never writes to any Salesforce org. Credentials sourced from environm
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import sys
+import tempfile
 import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import suppress
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlencode
 
 import click
-from dotenv import load_dotenv
 
-load_dotenv()
+# orjson is an optional speedup for the large JSON payloads the skills read and write; every
+# module that imports it falls back to stdlib json. orjson emits raw UTF-8 (no \u escapes),
+# so text written from its output must be opened as UTF-8.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Auth constants
@@ -34,6 +47,33 @@ REQUIRED_ENV = REQUIRED_ENV_SOAP  # backward-compat alias
 JWT_EXPIRY_SECONDS = 300  # Salesforce max: 5 min
 JWT_REQUEST_TIMEOUT = 30  # seconds
 
+# Pinned REST API version — keeps request URLs (and query cache keys) stable across client upgrades
+DEFAULT_API_VERSION = "59.0"
+
+# Scopes are I/O-bound; keep fan-out well under Salesforce's per-user concurrent request limit
+COLLECT_MAX_WORKERS = 4
+QUERY_MAX_WORKERS = 5  # per-scope fan-out of independent queries
+COMPOSITE_BATCH_LIMIT = 25  # Salesforce max subrequests per composite/batch call
+
+# Connection pool for the shared client session: one warm TLS socket per concurrent query.
+# Peak concurrency is every scope worker running a full query fan-out; query_all pages and
+# composite batches run sequentially within a worker, so each holds at most one socket.
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = COLLECT_MAX_WORKERS * QUERY_MAX_WORKERS
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# On-disk query result cache — opt-in (collect --cache-ttl N) for re-running collection during
+# development; assessments default to live org state, and cached files hold org configuration
+QUERY_CACHE_DIR = Path.home() / ".cache" / "sfdc_connect"
+QUERY_CACHE_TTL = 0  # seconds; 0 disables the cache
+UNAVAILABLE_CACHE_TTL = 86400  # how long an "object not exposed by this org" failure is remembered
+UNAVAILABLE_ERROR_CODES = ("INVALID_TYPE", "INVALID_FIELD")
+
+# Reused login session — opt-in, since the cache file holds a bearer token (900 = 15 min,
+# Salesforce's shortest configurable session timeout, is a sensible value when enabling it)
+SESSION_CACHE_DIR = QUERY_CACHE_DIR
+SESSION_CACHE_TTL = 0  # seconds; set SF_SESSION_CACHE_TTL > 0 to enable
+
 
 # ---------------------------------------------------------------------------
 # Auth helpers
@@ -80,8 +120,48 @@ def _resolve_auth_method(cli_flag: str | None) -> str:
     return method
 
 
+def _write_private(path: Path, payload: bytes) -> None:
+    """Atomically write payload to an owner-only file (0600) in an owner-only directory (0700)."""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")  # created 0600
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _api_version() -> str:
+    """Return the Salesforce REST API version: SF_API_VERSION env > DEFAULT_API_VERSION."""
+    return os.getenv("SF_API_VERSION") or DEFAULT_API_VERSION
+
+
+def _tune_session(sf: Any) -> Any:
+    """Mount a pooled, retrying HTTPS adapter on the client's requests.Session.
+
+    The default adapter keeps only 10 sockets, fewer than the parallel collectors use,
+    so extra requests would pay a fresh TLS handshake each. GETs on transient
+    5xx/429 responses are retried with backoff.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=HTTP_RETRY_STATUSES),
+    )
+    sf.session.mount("https://", adapter)
+    return sf
+
+
 def _connect_jwt() -> Any:
-    """Return an authenticated Salesforce client using JWT Bearer Flow (read-only use only)."""
+    """Return an authenticated Salesforce client using JWT Bearer Flow (read-only use only).
+
+    Required env vars are checked by _connect before this is called.
+    """
     try:
         import jwt as pyjwt
     except ImportError:
@@ -94,8 +174,6 @@ def _connect_jwt() -> Any:
         click.echo("ERROR: simple-salesforce not installed. Run: uv pip install simple-salesforce", err=True)
         sys.exit(1)
 
-    _check_env(AUTH_METHOD_JWT)
-
     key_path = os.environ["SF_PRIVATE_KEY_PATH"]
     try:
         private_key = Path(key_path).read_bytes()
@@ -160,48 +238,155 @@ def _connect_jwt() -> Any:
         click.echo(f"ERROR: JWT response missing access_token or instance_url: {result}", err=True)
         sys.exit(1)
 
-    return Salesforce(instance_url=instance_url, session_id=access_token)
+    return _tune_session(Salesforce(instance_url=instance_url, session_id=access_token, version=_api_version()))
 
 
-def _connect(auth_method: str = AUTH_METHOD_SOAP) -> Any:
-    """Return an authenticated Salesforce client (read-only use only)."""
-    if auth_method == AUTH_METHOD_JWT:
-        return _connect_jwt()
+def _connect_soap() -> Any:
+    """Return an authenticated Salesforce client using SOAP username/password login.
 
+    Required env vars are checked by _connect before this is called.
+    """
     try:
         from simple_salesforce import Salesforce
     except ImportError:
         click.echo("ERROR: simple-salesforce not installed. Run: uv pip install simple-salesforce", err=True)
         sys.exit(1)
 
-    _check_env(AUTH_METHOD_SOAP)
-    return Salesforce(
-        username=os.environ["SF_USERNAME"],
-        password=os.environ["SF_PASSWORD"],
-        security_token=os.environ.get("SF_SECURITY_TOKEN", ""),
-        domain=os.environ.get("SF_DOMAIN", "login"),
-        instance_url=os.environ.get("SF_INSTANCE_URL") or None,
+    return _tune_session(
+        Salesforce(
+            username=os.environ["SF_USERNAME"],
+            password=os.environ["SF_PASSWORD"],
+            security_token=os.environ.get("SF_SECURITY_TOKEN", ""),
+            domain=os.environ.get("SF_DOMAIN", "login"),
+            instance_url=os.environ.get("SF_INSTANCE_URL") or None,
+            version=_api_version(),
+        )
     )
 
 
-def _result_envelope(org: str, env: str, scope: str, data: Any) -> dict:
-    return {
+def _session_cache_ttl() -> int:
+    try:
+        return max(0, int(os.getenv("SF_SESSION_CACHE_TTL", SESSION_CACHE_TTL)))
+    except ValueError:
+        return SESSION_CACHE_TTL
+
+
+def _credential_fingerprint(auth_method: str) -> str:
+    """Digest of the secret material behind a login, so changed credentials never reuse a cached session."""
+    digest = hashlib.sha256()
+    if auth_method == AUTH_METHOD_JWT:
+        key_path = os.getenv("SF_PRIVATE_KEY_PATH", "")
+        digest.update(os.getenv("SF_CONSUMER_KEY", "").encode() + b"\0" + key_path.encode() + b"\0")
+        with suppress(OSError):
+            digest.update(Path(key_path).read_bytes())
+    else:
+        digest.update(os.getenv("SF_PASSWORD", "").encode() + b"\0" + os.getenv("SF_SECURITY_TOKEN", "").encode())
+    return digest.hexdigest()
+
+
+def _session_cache_path(auth_method: str) -> Path:
+    """One cache file per login identity and credential set, so switching user, org or secret never reuses a session."""
+    identity = "|".join(
+        [
+            auth_method,
+            os.getenv("SF_USERNAME", ""),
+            os.getenv("SF_DOMAIN", "login"),
+            os.getenv("SF_INSTANCE_URL", ""),
+            _credential_fingerprint(auth_method),
+        ]
+    )
+    return SESSION_CACHE_DIR / f"session-{hashlib.sha256(identity.encode()).hexdigest()[:16]}.json"
+
+
+def _save_session(auth_method: str, sf: Any) -> None:
+    ttl = _session_cache_ttl()
+    if not ttl:
+        return
+    entry = {
+        "instance_url": f"https://{sf.sf_instance}",
+        "session_id": sf.session_id,
+        "expires_at": time.time() + ttl,
+    }
+    try:
+        _write_private(_session_cache_path(auth_method), json.dumps(entry).encode())
+    except OSError:
+        pass  # cache is best-effort
+
+
+def _load_cached_session(auth_method: str) -> Any | None:
+    """Return a client built from a cached, still-valid session, or None to force a fresh login.
+
+    The session is probed with one lightweight REST call; an expired or revoked token (401)
+    discards the cache entry so the caller logs in again.
+    """
+    if not _session_cache_ttl():
+        return None
+    path = _session_cache_path(auth_method)
+    try:
+        entry = json.loads(path.read_bytes())
+        if entry["expires_at"] <= time.time():
+            with suppress(OSError):
+                path.unlink()
+            return None
+        from simple_salesforce import Salesforce
+
+        sf = _tune_session(
+            Salesforce(instance_url=entry["instance_url"], session_id=entry["session_id"], version=_api_version())
+        )
+        sf.restful("")
+        return sf
+    except FileNotFoundError:
+        return None
+    except Exception:
+        with suppress(OSError):
+            path.unlink()
+        return None
+
+
+def _connect(auth_method: str = AUTH_METHOD_SOAP, reuse_session: bool = True) -> Any:
+    """Return an authenticated Salesforce client (read-only use only).
+
+    When SF_SESSION_CACHE_TTL is set, a session from a recent login with the same identity and
+    credentials is reused, skipping the SOAP / JWT token round trips. reuse_session=False always
+    logs in (the fresh session is still cached for later runs).
+    """
+    _check_env(auth_method)
+    sf = _load_cached_session(auth_method) if reuse_session else None
+    if sf is None:
+        sf = _connect_jwt() if auth_method == AUTH_METHOD_JWT else _connect_soap()
+        _save_session(auth_method, sf)
+    return sf
+
+
+def _result_envelope(org: str, env: str, scope: str, data: Any, cached_scopes: dict[str, str] | None = None) -> dict:
+    envelope = {
         "org": org,
         "env": env,
         "collected_at_utc": datetime.now(UTC).isoformat(),
         "scope": scope,
         "raw": data,
     }
+    if cached_scopes is not None:
+        # Scopes with results replayed from the query cache → when the oldest of them was fetched
+        envelope["cached_scopes"] = cached_scopes
+    return envelope
 
 
 def _write_output(result: dict, out: str | None) -> None:
-    payload = json.dumps(result, indent=2, default=str)
     if out:
-        with open(out, "w") as f:
-            f.write(payload)
+        if orjson is not None:
+            # orjson pretty-prints in C straight to UTF-8 bytes
+            Path(out).write_bytes(orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            # Encode incrementally — large record sets never exist as one pretty-printed string
+            encoder = json.JSONEncoder(indent=2, default=str)
+            with open(out, "w", encoding="utf-8") as f:
+                f.writelines(encoder.iterencode(result))
         click.echo(f"Wrote {len(result.get('raw', {}))} items → {out}")
+    elif orjson is not None:
+        click.echo(orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2).decode())
     else:
-        click.echo(payload)
+        click.echo(json.dumps(result, indent=2, default=str))
 
 
 # ---------------------------------------------------------------------------
@@ -209,157 +394,393 @@ def _write_output(result: dict, out: str | None) -> None:
 # ---------------------------------------------------------------------------
 
 
-def collect_auth(sf: Any) -> dict:
-    """Auth: SSO, MFA, login IP ranges, session settings."""
-    data: dict[str, Any] = {}
+QueryTask = tuple[str, Callable[[], Any], Callable[[Exception], Any] | None]
 
-    # Session settings via Tooling API — use Metadata blob (field names vary by API version)
-    try:
-        tooling_result = sf.restful(
-            "tooling/query",
-            params={"q": "SELECT Metadata FROM SecuritySettings LIMIT 1"},
-        )
-        data["session_settings"] = tooling_result
-    except Exception as exc:
-        data["session_settings"] = {"error": str(exc), "note": "Requires Tooling API access"}
 
-    # MFA enforcement via Tooling API (Identity Verification setting)
-    try:
-        mfa_result = sf.restful(
-            "tooling/query",
-            params={
-                "q": "SELECT MultiFactorAuthenticationForUserUI, MultiFactorAuthenticationForUserUIBlock"
-                " FROM OrganizationSettings LIMIT 1"
-            },
-        )
-        data["mfa_org_settings"] = mfa_result
-    except Exception as exc:
-        data["mfa_org_settings"] = {"error": str(exc), "note": "OrganizationSettings MFA fields require API v57+"}
+@dataclass(frozen=True)
+class SoqlQuery:
+    """One collector query: result key, SOQL text, API surface, and optional failure placeholder.
 
-    # Identity providers (SSO config)
-    try:
-        data["sso_providers"] = sf.query_all("SELECT Id, Name, SamlVersion, IsEnabled FROM SamlSsoConfig")
-    except Exception:
-        data["sso_providers"] = {"totalSize": 0, "records": []}
+    A query without a fallback is mandatory — if it fails, the whole scope fails.
+    """
 
-    # Login IP ranges (trusted IPs)
-    try:
-        data["login_ip_ranges"] = sf.query_all("SELECT Id, ProfileId, StartAddress, EndAddress FROM LoginIpRange")
-    except Exception:
-        data["login_ip_ranges"] = {"totalSize": 0, "records": []}
+    key: str
+    soql: str
+    tooling: bool = False
+    fallback: Callable[[Exception], Any] | None = None
 
-    # MFA: check if MFA is enforced via connected app or org setting
+
+def _empty_records(_exc: Exception) -> dict:
+    return {"totalSize": 0, "records": []}
+
+
+@dataclass(frozen=True)
+class QueryCache:
+    """Disk cache of raw query results, keyed by org instance + user + API version + surface + SOQL text.
+
+    Entries older than ttl seconds are ignored. Files are owner-only (0600) since they hold
+    org configuration. Only successful results are cached — never fallback placeholders —
+    plus, separately, optional queries the org rejected as unsupported (unavailable_ttl).
+    Results served from disk are recorded in hits (query key → cache file mtime).
+    """
+
+    directory: Path = QUERY_CACHE_DIR
+    ttl: int = QUERY_CACHE_TTL
+    unavailable_ttl: int = UNAVAILABLE_CACHE_TTL
+    hits: dict[str, float] = field(default_factory=dict, init=False, compare=False, repr=False)
+
+    def _read(self, path: Path, ttl: int) -> tuple[Any, float] | None:
+        try:
+            mtime = path.stat().st_mtime
+            if time.time() - mtime > ttl:
+                return None
+            return json.loads(path.read_bytes()), mtime
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: Path, payload: Any) -> None:
+        try:
+            _write_private(path, json.dumps(payload, default=str).encode())
+        except OSError:
+            pass  # cache is best-effort
+
+    def get(self, sf: Any, query: SoqlQuery) -> Any | None:
+        entry = self._read(self.directory / f"{_query_digest(sf, query)}.json", self.ttl)
+        if entry is None:
+            return None
+        result, mtime = entry
+        self.hits[query.key] = mtime
+        return result
+
+    def oldest_hit_utc(self) -> str | None:
+        """ISO timestamp of the oldest cached result served, or None if nothing came from disk."""
+        return datetime.fromtimestamp(min(self.hits.values()), UTC).isoformat() if self.hits else None
+
+    def put(self, sf: Any, query: SoqlQuery, result: Any) -> None:
+        self._write(self.directory / f"{_query_digest(sf, query)}.json", result)
+
+    def get_unavailable(self, sf: Any, query: SoqlQuery) -> str | None:
+        entry = self._read(self.directory / f"{_query_digest(sf, query)}.unavailable.json", self.unavailable_ttl)
+        return entry[0].get("error") if entry is not None and isinstance(entry[0], dict) else None
+
+    def put_unavailable(self, sf: Any, query: SoqlQuery, error: str) -> None:
+        self._write(self.directory / f"{_query_digest(sf, query)}.unavailable.json", {"error": error})
+
+
+# Optional queries this process has seen rejected as unsupported: query digest → error text
+_unavailable_queries: dict[str, str] = {}
+
+
+def _query_digest(sf: Any, query: SoqlQuery) -> str:
+    # Results depend on the running user's permissions and the API version, not just the org
+    surface = "tooling" if query.tooling else "data"
+    identity = f"{sf.sf_instance}|{os.getenv('SF_USERNAME', '')}|{sf.sf_version}"
+    return hashlib.sha256(f"{identity}|{surface}|{query.soql}".encode()).hexdigest()
+
+
+def _known_unavailable(sf: Any, query: SoqlQuery, cache: QueryCache | None) -> str | None:
+    """Return the remembered error if this optional query is known to be unsupported by the org."""
+    if query.fallback is None:
+        return None
+    digest = _query_digest(sf, query)
+    error = _unavailable_queries.get(digest)
+    if error is None and cache is not None:
+        error = cache.get_unavailable(sf, query)
+        if error is not None:
+            _unavailable_queries[digest] = error
+    return error
+
+
+def _record_unavailable(sf: Any, query: SoqlQuery, cache: QueryCache | None, exc: Exception) -> None:
+    """Remember an optional query the org rejected because the object or field is not exposed."""
+    error = str(exc)
+    if query.fallback is None or not any(code in error for code in UNAVAILABLE_ERROR_CODES):
+        return
+    _unavailable_queries[_query_digest(sf, query)] = error
+    if cache is not None:
+        cache.put_unavailable(sf, query, error)
+
+
+def _run_query(sf: Any, query: SoqlQuery) -> Any:
+    if query.tooling:
+        return sf.restful("tooling/query", params={"q": query.soql})
+    return sf.query_all(query.soql)
+
+
+def _run_cached_query(sf: Any, query: SoqlQuery, cache: QueryCache | None) -> Any:
     try:
-        data["mfa_policies"] = sf.query_all(
-            "SELECT Id, DeveloperName, IsEnabled FROM TransactionSecurityPolicy WHERE ActionConfig LIKE '%TwoFactor%'"
-        )
-    except Exception:
-        data["mfa_policies"] = {"totalSize": 0, "records": []}
+        result = _run_query(sf, query)
+    except Exception as exc:
+        _record_unavailable(sf, query, cache, exc)
+        raise
+    if cache is not None:
+        cache.put(sf, query, result)
+    return result
 
-    return data
 
+def _run_queries(tasks: list[QueryTask]) -> dict[str, Any]:
+    """Run a collector's independent queries concurrently and return {key: result} in task order.
 
-def collect_access(sf: Any) -> dict:
-    """Access: profiles with system admin, permission sets, connected apps."""
+    Each task is (key, call, fallback). A failing task with a fallback records fallback(exc);
+    one without a fallback re-raises, failing the whole scope as a sequential call would.
+    """
     data: dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=min(QUERY_MAX_WORKERS, len(tasks))) as pool:
+        pending = [(key, pool.submit(call), fallback) for key, call, fallback in tasks]
+        for key, future, fallback in pending:
+            try:
+                data[key] = future.result()
+            except Exception as exc:
+                if fallback is None:
+                    raise
+                data[key] = fallback(exc)
+    return data
+
+
+def _drain_pages(sf: Any, result: dict) -> dict:
+    """Follow nextRecordsUrl so a batched query returns every record, as query_all would."""
+    records = list(result.get("records", []))
+    while not result.get("done", True) and result.get("nextRecordsUrl"):
+        result = sf.query_more(result["nextRecordsUrl"], identifier_is_url=True)
+        records.extend(result.get("records", []))
+    result["records"] = records
+    return result
+
+
+def _composite_batch(sf: Any, queries: Sequence[SoqlQuery]) -> dict[str, Any]:
+    """Run queries through the Composite Batch API — up to 25 subrequests per HTTP round trip.
+
+    Returns {key: result} for the subrequests that succeeded; failed ones are left out.
+    """
+    results: dict[str, Any] = {}
+    for start in range(0, len(queries), COMPOSITE_BATCH_LIMIT):
+        chunk = queries[start : start + COMPOSITE_BATCH_LIMIT]
+        body = {
+            "batchRequests": [
+                {
+                    "method": "GET",
+                    "url": f"v{sf.sf_version}/{'tooling/' if q.tooling else ''}query/?{urlencode({'q': q.soql})}",
+                }
+                for q in chunk
+            ]
+        }
+        response = sf.restful("composite/batch", method="POST", json=body)
+        for query, sub in zip(chunk, response.get("batchResults", []), strict=False):
+            if sub.get("statusCode", 500) >= 400:
+                continue
+            result = sub.get("result") or {}
+            results[query.key] = result if query.tooling else _drain_pages(sf, result)
+    return results
+
+
+def _collect_queries(sf: Any, queries: Sequence[SoqlQuery], cache: QueryCache | None = None) -> dict[str, Any]:
+    """Collect a scope's queries in one Composite Batch request.
+
+    Optional queries the org is known not to support go straight to their fallback, and
+    queries with a fresh entry in cache are served from disk. Subrequests that fail inside
+    the batch — or every query, if the composite call itself fails — are re-run individually
+    (and concurrently) so each keeps its own fallback.
+    """
+    results: dict[str, Any] = {}
+    for q in queries:
+        error = _known_unavailable(sf, q, cache)
+        if error is not None:
+            results[q.key] = q.fallback(RuntimeError(error))
+        elif cache is not None:
+            hit = cache.get(sf, q)
+            if hit is not None:
+                results[q.key] = hit
+    fetch = [q for q in queries if q.key not in results]
+
+    fetched: dict[str, Any] = {}
+    if len(fetch) > 1:
+        try:
+            fetched = _composite_batch(sf, fetch)
+        except Exception:
+            fetched = {}
+    if cache is not None:
+        for q in fetch:
+            if q.key in fetched:
+                cache.put(sf, q, fetched[q.key])
+
+    retry = [q for q in fetch if q.key not in fetched]
+    if retry:
+        fetched.update(_run_queries([(q.key, partial(_run_cached_query, sf, q, cache), q.fallback) for q in retry]))
+    results.update(fetched)
+    return {q.key: results[q.key] for q in queries}
+
+
+# Collector queries, grouped by scope — built once at import, shared by every run.
+# Inventory queries are deliberately unbounded: a LIMIT would silently drop records (missed
+# admin profiles or connected apps are false negatives), and query_all / _drain_pages already
+# follow every page.
+
+AUTH_QUERIES: tuple[SoqlQuery, ...] = (
+    # Session settings via Tooling API — use Metadata blob (field names vary by API version)
+    SoqlQuery(
+        "session_settings",
+        "SELECT Metadata FROM SecuritySettings LIMIT 1",
+        tooling=True,
+        fallback=lambda exc: {"error": str(exc), "note": "Requires Tooling API access"},
+    ),
+    # MFA enforcement via Tooling API (Identity Verification setting)
+    SoqlQuery(
+        "mfa_org_settings",
+        "SELECT MultiFactorAuthenticationForUserUI, MultiFactorAuthenticationForUserUIBlock"
+        " FROM OrganizationSettings LIMIT 1",
+        tooling=True,
+        fallback=lambda exc: {"error": str(exc), "note": "OrganizationSettings MFA fields require API v57+"},
+    ),
+    # Identity providers (SSO config)
+    SoqlQuery(
+        "sso_providers",
+        "SELECT Id, Name, SamlVersion, IsEnabled FROM SamlSsoConfig",
+        fallback=_empty_records,
+    ),
+    # Login IP ranges (trusted IPs)
+    SoqlQuery(
+        "login_ip_ranges",
+        "SELECT Id, ProfileId, StartAddress, EndAddress FROM LoginIpRange",
+        fallback=_empty_records,
+    ),
+    # MFA: check if MFA is enforced via connected app or org setting
+    SoqlQuery(
+        "mfa_policies",
+        "SELECT Id, DeveloperName, IsEnabled FROM TransactionSecurityPolicy WHERE ActionConfig LIKE '%TwoFactor%'",
+        fallback=_empty_records,
+    ),
+)
+
 
+ACCESS_QUERIES: tuple[SoqlQuery, ...] = (
     # Profiles with system admin or modify all data
-    data["admin_profiles"] = sf.query_all(
+    SoqlQuery(
+        "admin_profiles",
         "SELECT Id, Name, PermissionsModifyAllData, PermissionsManageUsers, "
         "PermissionsViewAllData FROM Profile WHERE PermissionsModifyAllData = true "
-        "OR PermissionsManageUsers = true ORDER BY Name"
-    )
-
+        "OR PermissionsManageUsers = true ORDER BY Name",
+    ),
     # Permission sets with elevated permissions
-    data["elevated_permission_sets"] = sf.query_all(
+    SoqlQuery(
+        "elevated_permission_sets",
         "SELECT Id, Name, Label, PermissionsModifyAllData, PermissionsViewAllData, "
         "PermissionsManageUsers FROM PermissionSet WHERE PermissionsModifyAllData = true "
-        "OR PermissionsManageUsers = true ORDER BY Name"
-    )
-
+        "OR PermissionsManageUsers = true ORDER BY Name",
+    ),
     # Connected apps (OAuth clients)
-    data["connected_apps"] = sf.query_all(
+    SoqlQuery(
+        "connected_apps",
         "SELECT Id, Name, OptionsAllowAdminApprovedUsersOnly, OptionsRefreshTokenValidityMetric "
-        "FROM ConnectedApplication ORDER BY Name"
-    )
+        "FROM ConnectedApplication ORDER BY Name",
+    ),
+)
 
-    return data
 
+EVENT_MONITORING_QUERIES: tuple[SoqlQuery, ...] = (
+    # Event log file types available (indicates what monitoring is enabled) — one row per type
+    SoqlQuery(
+        "event_log_types",
+        "SELECT EventType FROM EventLogFile WHERE LogDate = LAST_N_DAYS:7 GROUP BY EventType",
+    ),
+    # Check field audit trail / field history (metadata count as proxy)
+    SoqlQuery(
+        "field_history_retention",
+        "SELECT Id, EntityDefinition.QualifiedApiName FROM FieldDefinition "
+        "WHERE IsAiPredictionField = false AND IsHistoryTracked = true LIMIT 100",
+        fallback=_empty_records,
+    ),
+)
 
-def collect_event_monitoring(sf: Any) -> dict:
-    """Event Monitoring: storage, enabled event types."""
-    data: dict[str, Any] = {}
 
-    # Event log file types available (indicates what monitoring is enabled)
-    data["event_log_types"] = sf.query_all(
-        "SELECT EventType, LogDate, LogFileLength FROM EventLogFile "
-        "WHERE LogDate = LAST_N_DAYS:7 ORDER BY LogDate DESC LIMIT 200"
-    )
+TRANSACTION_SECURITY_QUERIES: tuple[SoqlQuery, ...] = (
+    SoqlQuery(
+        "policies",
+        "SELECT Id, DeveloperName, EventName, ExecutionUserId, BlockMessage "
+        "FROM TransactionSecurityPolicy ORDER BY EventName",
+    ),
+)
 
-    # Check field audit trail / field history (metadata count as proxy)
-    try:
-        data["field_history_retention"] = sf.query_all(
-            "SELECT Id, EntityDefinition.QualifiedApiName FROM FieldDefinition "
-            "WHERE IsAiPredictionField = false AND IsHistoryTracked = true LIMIT 100"
-        )
-    except Exception:
-        data["field_history_retention"] = {"totalSize": 0, "records": []}
 
-    return data
+INTEGRATIONS_QUERIES: tuple[SoqlQuery, ...] = (
+    SoqlQuery(
+        "named_credentials",
+        "SELECT Id, DeveloperName, Endpoint FROM NamedCredential ORDER BY DeveloperName",
+    ),
+    # RemoteProxy is a Tooling API metadata object — not queryable via standard SOQL
+    SoqlQuery(
+        "remote_site_settings",
+        "SELECT Id, SiteName, EndpointUrl, IsActive, DisableProtocolSecurity FROM RemoteProxy ORDER BY SiteName",
+        tooling=True,
+        fallback=lambda exc: {
+            "totalSize": 0,
+            "records": [],
+            "note": f"RemoteSiteSettings not queryable via Tooling API ({exc}) — check Setup > Remote Site Settings",
+        },
+    ),
+)
 
 
-def collect_transaction_security(sf: Any) -> dict:
-    """Transaction Security Policies (automated threat response rules)."""
-    return {
-        "policies": sf.query_all(
-            "SELECT Id, DeveloperName, EventName, ExecutionUserId, BlockMessage "
-            "FROM TransactionSecurityPolicy ORDER BY EventName"
-        )
-    }
+OAUTH_QUERIES: tuple[SoqlQuery, ...] = (
+    SoqlQuery(
+        "connected_app_oauth_policies",
+        "SELECT Id, Name, OptionsAllowAdminApprovedUsersOnly, OptionsRefreshTokenValidityMetric "
+        "FROM ConnectedApplication ORDER BY Name",
+    ),
+)
 
 
-def collect_integrations(sf: Any) -> dict:
-    """Named credentials and remote site settings (outbound integration points)."""
-    data: dict[str, Any] = {}
+SECCONF_QUERIES: tuple[SoqlQuery, ...] = (
+    SoqlQuery(
+        "health_check",
+        "SELECT Score, LastModifiedDate FROM SecurityHealthCheck LIMIT 1",
+        fallback=lambda _exc: {
+            "note": "SecurityHealthCheck not available via SOQL — check Setup > Security Health Check in UI"
+        },
+    ),
+)
 
-    data["named_credentials"] = sf.query_all(
-        "SELECT Id, DeveloperName, Endpoint FROM NamedCredential ORDER BY DeveloperName"
-    )
 
-    try:
-        # RemoteProxy is a Tooling API metadata object — not queryable via standard SOQL
-        _rss_query = (
-            "SELECT Id, SiteName, EndpointUrl, IsActive, DisableProtocolSecurity FROM RemoteProxy ORDER BY SiteName"
-        )
-        tooling_result = sf.restful("tooling/query", params={"q": _rss_query})
-        data["remote_site_settings"] = tooling_result
-    except Exception as exc:
-        data["remote_site_settings"] = {
-            "totalSize": 0,
-            "records": [],
-            "note": f"RemoteSiteSettings not queryable via Tooling API ({exc}) — check Setup > Remote Site Settings",
-        }
+# Organization lookups used by the auth and org-info commands
+ORG_IDENTITY_SOQL = "SELECT Id, Name, OrganizationType FROM Organization LIMIT 1"
+ORG_INFO_SOQL = (
+    "SELECT Id, Name, OrganizationType, InstanceName, IsSandbox, "
+    "LanguageLocaleKey, TimeZoneSidKey, UsedLicenses FROM Organization LIMIT 1"
+)
+
+
+def collect_auth(sf: Any, cache: QueryCache | None = None) -> dict:
+    """Auth: SSO, MFA, login IP ranges, session settings."""
+    return _collect_queries(sf, AUTH_QUERIES, cache)
+
+
+def collect_access(sf: Any, cache: QueryCache | None = None) -> dict:
+    """Access: profiles with system admin, permission sets, connected apps."""
+    return _collect_queries(sf, ACCESS_QUERIES, cache)
+
+
+def collect_event_monitoring(sf: Any, cache: QueryCache | None = None) -> dict:
+    """Event Monitoring: storage, enabled event types."""
+    return _collect_queries(sf, EVENT_MONITORING_QUERIES, cache)
 
-    return data
 
+def collect_transaction_security(sf: Any, cache: QueryCache | None = None) -> dict:
+    """Transaction Security Policies (automated threat response rules)."""
+    return _collect_queries(sf, TRANSACTION_SECURITY_QUERIES, cache)
 
-def collect_oauth(sf: Any) -> dict:
+
+def collect_integrations(sf: Any, cache: QueryCache | None = None) -> dict:
+    """Named credentials and remote site settings (outbound integration points)."""
+    return _collect_queries(sf, INTEGRATIONS_QUERIES, cache)
+
+
+def collect_oauth(sf: Any, cache: QueryCache | None = None) -> dict:
     """OAuth policies on connected apps."""
-    return {
-        "connected_app_oauth_policies": sf.query_all(
-            "SELECT Id, Name, OptionsAllowAdminApprovedUsersOnly, OptionsRefreshTokenValidityMetric "
-            "FROM ConnectedApplication ORDER BY Name"
-        )
-    }
+    return _collect_queries(sf, OAUTH_QUERIES, cache)
 
 
-def collect_secconf(sf: Any) -> dict:
+def collect_secconf(sf: Any, cache: QueryCache | None = None) -> dict:
     """Security health check baseline score."""
-    try:
-        data = sf.query_all("SELECT Score, LastModifiedDate FROM SecurityHealthCheck LIMIT 1")
-    except Exception:
-        data = {"note": "SecurityHealthCheck not available via SOQL — check Setup > Security Health Check in UI"}
-    return {"health_check": data}
+    return _collect_queries(sf, SECCONF_QUERIES, cache)
 
 
 SCOPE_COLLECTORS = {
@@ -383,6 +804,10 @@ VALID_SCOPES = list(SCOPE_COLLECTORS.keys()) + ["all"]
 @click.group()
 def cli() -> None:
     """sfdc-connect — read-only Salesforce org config collector for security assessment."""
+    # Loaded here rather than at import so --help, completion and importers skip the .env read
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 
 @cli.command()
@@ -398,8 +823,24 @@ def cli() -> None:
     type=click.Choice(list(VALID_AUTH_METHODS)),
     help="Auth method override (default: SF_AUTH_METHOD env var or 'soap')",
 )
+@click.option("--no-cache", is_flag=True, help="Always query the org; ignore and skip the on-disk result cache")
+@click.option(
+    "--cache-ttl",
+    default=QUERY_CACHE_TTL,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Reuse query results cached within this many seconds (0 disables; cache dir: ~/.cache/sfdc_connect)",
+)
 def collect(
-    org: str | None, scope: str, out: str | None, env: str, timeout: int, dry_run: bool, auth_method: str | None
+    org: str | None,
+    scope: str,
+    out: str | None,
+    env: str,
+    timeout: int,
+    dry_run: bool,
+    auth_method: str | None,
+    no_cache: bool,
+    cache_ttl: int,
 ) -> None:
     """Collect security-relevant configuration from a Salesforce org."""
     org_label = org or os.getenv("SFDC_ORG_ALIAS", os.getenv("SF_INSTANCE_URL", "unknown"))
@@ -417,17 +858,27 @@ def collect(
         sf.sf_instance = org.replace("https://", "").rstrip("/")
 
     scopes_to_run = list(SCOPE_COLLECTORS.keys()) if scope == "all" else [scope]
-    combined: dict[str, Any] = {}
-
-    for s in scopes_to_run:
-        click.echo(f"  collecting: {s}", err=True)
-        try:
-            combined[s] = SCOPE_COLLECTORS[s](sf)
-        except Exception as exc:
-            combined[s] = {"error": str(exc)}
-            click.echo(f"  WARNING: {s} failed — {exc}", err=True)
-
-    result = _result_envelope(org_label, env, scope, combined)
+    # One cache view per scope, so the envelope can say which scopes were replayed from disk
+    use_cache = cache_ttl > 0 and not no_cache
+    caches = {s: QueryCache(QUERY_CACHE_DIR, cache_ttl) if use_cache else None for s in scopes_to_run}
+    collected: dict[str, Any] = {}
+
+    # Scopes are independent round trips — run them concurrently on the shared client session
+    with ThreadPoolExecutor(max_workers=min(COLLECT_MAX_WORKERS, len(scopes_to_run))) as pool:
+        click.echo("\n".join(f"  collecting: {s}" for s in scopes_to_run), err=True)
+        futures = {pool.submit(SCOPE_COLLECTORS[s], sf, caches[s]): s for s in scopes_to_run}
+        for future in as_completed(futures):
+            s = futures[future]
+            try:
+                collected[s] = future.result()
+            except Exception as exc:
+                collected[s] = {"error": str(exc)}
+                click.echo(f"  WARNING: {s} failed — {exc}", err=True)
+
+    # Keep output key order stable regardless of completion order
+    combined = {s: collected[s] for s in scopes_to_run}
+    cached_scopes = {s: c.oldest_hit_utc() for s, c in caches.items() if c is not None and c.hits}
+    result = _result_envelope(org_label, env, scope, combined, cached_scopes)
     _write_output(result, out)
 
 
@@ -452,8 +903,9 @@ def auth(dry_run: bool, auth_method: str | None) -> None:
         click.echo(f"OK — all required env vars set for {effective_method} auth (dry-run, no connection made)")
         return
 
-    sf = _connect(effective_method)
-    org_info = sf.query_all("SELECT Id, Name, OrganizationType FROM Organization LIMIT 1")
+    # Always log in — this command exists to verify the credentials, not a cached session
+    sf = _connect(effective_method, reuse_session=False)
+    org_info = sf.query_all(ORG_IDENTITY_SOQL)
     if org_info["totalSize"] == 1:
         rec = org_info["records"][0]
         click.echo(f"OK — connected to: {rec['Name']} ({rec['OrganizationType']}) id={rec['Id']}")
@@ -467,12 +919,13 @@ def org_info(out: str | None) -> None:
     """Retrieve basic org metadata (name, edition, features, limits)."""
     sf = _connect()
 
-    data: dict[str, Any] = {}
-    data["organization"] = sf.query_all(
-        "SELECT Id, Name, OrganizationType, InstanceName, IsSandbox, "
-        "LanguageLocaleKey, TimeZoneSidKey, UsedLicenses FROM Organization LIMIT 1"
+    # Independent round trips — fetch org record and limits concurrently
+    data = _run_queries(
+        [
+            ("organization", partial(sf.query_all, ORG_INFO_SOQL), None),
+            ("limits", sf.limits, None),
+        ]
     )
-    data["limits"] = sf.limits()
 
     result = _result_envelope(
         org=os.getenv("SF_INSTANCE_URL", "unknown"),
@@ -11,18 +11,29 @@ from __future__ import annotations
 
 import json
 import sys
+from collections import Counter, defaultdict
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import click
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Scoring helpers
 # ---------------------------------------------------------------------------
 
 STATUS_SCORE = {"pass": 1.0, "partial": 0.5, "fail": 0.0}
 
+# Severity ordinal for a control's worst finding; unknown statuses rank as not_applicable.
+_STATUS_RANK = {"": 0, "not_applicable": 0, "pass": 1, "partial": 2, "fail": 3}
+_RANK_LABEL = ("not_applicable", "pass", "partial", "fail")
+
 
 def _domain_status(score: float | None, threshold: float) -> str:
     if score is None:
@@ -34,16 +45,15 @@ def _domain_status(score: float | None, threshold: float) -> str:
     return "red"
 
 
-def _score_findings(items: list[dict[str, Any]]) -> tuple[int, int, int, int, float]:
-    """Return (pass, partial, fail, not_applicable, score)."""
-    counts = {"pass": 0, "partial": 0, "fail": 0, "not_applicable": 0}
-    for item in items:
-        status = item.get("status", "")
-        if status in counts:
-            counts[status] += 1
+def _score_from_counts(counts: Mapping[str, int]) -> tuple[int, int, int, int, float]:
+    """Return (pass, partial, fail, not_applicable, score) from per-status counts."""
+    passes = counts.get("pass", 0)
+    partials = counts.get("partial", 0)
+    fails = counts.get("fail", 0)
+    nas = counts.get("not_applicable", 0)
 
-    scoreable = counts["pass"] + counts["partial"] + counts["fail"]
-    total = scoreable + counts["not_applicable"]
+    scoreable = passes + partials + fails
+    total = scoreable + nas
     if total == 0:
         # No findings mapped to this domain at all — not assessed via API
         score = None
@@ -51,9 +61,9 @@ def _score_findings(items: list[dict[str, Any]]) -> tuple[int, int, int, int, fl
         # All findings are not_applicable — exclude from numeric score
         score = None
     else:
-        score = (counts["pass"] * 1.0 + counts["partial"] * 0.5) / scoreable
+        score = (passes * 1.0 + partials * 0.5) / scoreable
 
-    return counts["pass"], counts["partial"], counts["fail"], counts["not_applicable"], score
+    return passes, partials, fails, nas, score
 
 
 # ---------------------------------------------------------------------------
@@ -68,7 +78,8 @@ def _load_sscf_index(path: Path) -> dict[str, dict[str, Any]]:
     except ModuleNotFoundError as exc:
         raise RuntimeError("PyYAML is required. Install with: pip install PyYAML") from exc
 
-    data = yaml.safe_load(path.read_text())
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(path.read_text(), Loader=loader)
     index = {}
     for ctrl in data.get("controls", []):
         cid = ctrl.get("sscf_control_id", "")
@@ -78,7 +89,8 @@ def _load_sscf_index(path: Path) -> dict[str, dict[str, Any]]:
 
 
 def _load_backlog(path: Path) -> dict[str, Any]:
-    data = json.loads(path.read_text())
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     if not isinstance(data, dict):
         raise ValueError(f"Expected JSON object in backlog file: {path}")
     return data
@@ -97,60 +109,56 @@ def run_benchmark(
     """Compute per-domain SSCF compliance scores from a gap-map backlog."""
     mapped_items: list[dict[str, Any]] = backlog.get("mapped_items", [])
 
-    # Build domain → {sscf_control_id → [items]} mapping
+    # Build domain → {sscf_control_id → [items]} mapping, plus a control → domain reverse index
     domain_controls: dict[str, dict[str, list[dict]]] = {}
-    for ctrl in sscf_index.values():
+    cid_to_domain: dict[str, str] = {}
+    for cid, ctrl in sscf_index.items():
         domain = ctrl["domain"]
-        cid = ctrl["sscf_control_id"]
         domain_controls.setdefault(domain, {})[cid] = []
+        cid_to_domain[cid] = domain
 
-    # Distribute backlog items into their SSCF domains
+    # Distribute backlog items into their SSCF domains, tallying statuses as we go
+    domain_counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
     unmatched_items: list[dict] = []
     for item in mapped_items:
         placed = False
         for sscf_cid in item.get("sscf_control_ids", []):
-            ctrl_meta = sscf_index.get(sscf_cid)
-            if ctrl_meta:
-                domain = ctrl_meta["domain"]
-                domain_controls.setdefault(domain, {}).setdefault(sscf_cid, []).append(item)
+            domain = cid_to_domain.get(sscf_cid)
+            if domain is not None:
+                domain_controls[domain][sscf_cid].append(item)
+                domain_counts[domain][item.get("status", "")] += 1
                 placed = True
         if not placed:
             unmatched_items.append(item)
 
     # Score each domain
     domain_results = []
-    for domain, controls in sorted(domain_controls.items()):
-        domain_items = [item for items in controls.values() for item in items]
-        passes, partials, fails, nas, score = _score_findings(domain_items)
+    for domain in sorted(domain_controls):
+        controls = domain_controls[domain]
+        sorted_cids = sorted(controls)
+        counts = domain_counts[domain]
+        passes, partials, fails, nas, score = _score_from_counts(counts)
 
         control_detail = []
-        for sscf_cid, items in sorted(controls.items()):
-            ctrl_meta = sscf_index.get(sscf_cid, {})
-            statuses = [i.get("status", "") for i in items]
-            worst = (
-                "fail"
-                if "fail" in statuses
-                else "partial"
-                if "partial" in statuses
-                else "pass"
-                if "pass" in statuses
-                else "not_applicable"
-            )
+        for sscf_cid in sorted_cids:
+            items = controls[sscf_cid]
+            ctrl_meta = sscf_index[sscf_cid]
+            worst = _RANK_LABEL[max((_STATUS_RANK.get(i.get("status", ""), 0) for i in items), default=0)]
             control_detail.append(
                 {
                     "sscf_control_id": sscf_cid,
                     "title": ctrl_meta.get("title", ""),
                     "owner_team": ctrl_meta.get("owner_team", ""),
                     "findings": [i.get("sbs_control_id", i.get("legacy_control_id", "")) for i in items],
-                    "worst_status": worst if items else "not_applicable",
+                    "worst_status": worst,
                 }
             )
 
         domain_results.append(
             {
                 "domain": domain,
-                "sscf_controls": sorted(controls.keys()),
-                "findings_count": len(domain_items),
+                "sscf_controls": sorted_cids,
+                "findings_count": counts.total(),
                 "pass": passes,
                 "partial": partials,
                 "fail": fails,
@@ -162,8 +170,7 @@ def run_benchmark(
         )
 
     # Overall score — only assessed domains (score is not None)
-    all_items = [item for items in domain_controls.values() for ctrl_items in items.values() for item in ctrl_items]
-    _, _, _, _, overall_score = _score_findings(all_items)
+    _, _, _, _, overall_score = _score_from_counts(sum(domain_counts.values(), Counter()))
 
     summary_counts = {"green": 0, "amber": 0, "red": 0, "not_assessed": 0}
     for dr in domain_results:
@@ -189,6 +196,12 @@ def run_benchmark(
     }
 
 
+def _to_json(report: dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(report, indent=2)
+
+
 # ---------------------------------------------------------------------------
 # Markdown renderer
 # ---------------------------------------------------------------------------
@@ -210,29 +223,34 @@ def _to_markdown(report: dict[str, Any]) -> str:
         "|---|---|---|---|---|---|---|",
     ]
     status_emoji = {"green": "✅", "amber": "⚠️", "red": "❌", "not_assessed": "—"}
+    # Format each domain's score/status once — both the scorecard and the detail sections use them
+    domain_rows = []
     for d in report["domains"]:
-        emoji = status_emoji.get(d["status"], "")
-        score_str = f"{int(d['score'] * 100)}%" if d["score"] is not None else "N/A"
-        lines.append(
-            f"| {d['domain']} | {score_str} | {emoji} {d['status'].upper()}"
+        score, status = d["score"], d["status"]
+        score_str = f"{int(score * 100)}%" if score is not None else "N/A"
+        domain_rows.append((d, score_str, status_emoji.get(status, ""), status.upper()))
+
+    add = lines.append
+    for d, score_str, emoji, status_label in domain_rows:
+        add(
+            f"| {d['domain']} | {score_str} | {emoji} {status_label}"
             f" | {d['pass']} | {d['partial']} | {d['fail']} | {d['not_applicable']} |"
         )
 
+    summary = report["summary"]
     lines += [
         "",
         "## Summary",
         "",
-        f"- Domains GREEN: `{report['summary']['domains_green']}`",
-        f"- Domains AMBER: `{report['summary']['domains_amber']}`",
-        f"- Domains RED: `{report['summary']['domains_red']}`",
-        f"- Unmatched findings: `{report['summary']['unmatched_findings']}`",
+        f"- Domains GREEN: `{summary['domains_green']}`",
+        f"- Domains AMBER: `{summary['domains_amber']}`",
+        f"- Domains RED: `{summary['domains_red']}`",
+        f"- Unmatched findings: `{summary['unmatched_findings']}`",
         "",
         "## Domain Details",
     ]
 
-    for d in report["domains"]:
-        emoji = status_emoji.get(d["status"], "")
-        score_str = f"{int(d['score'] * 100)}%" if d["score"] is not None else "N/A"
+    for d, score_str, emoji, _ in domain_rows:
         lines += [
             "",
             f"### {d['domain']} — {score_str} {emoji}",
@@ -241,8 +259,9 @@ def _to_markdown(report: dict[str, Any]) -> str:
             "|---|---|---|---|",
         ]
         for ctrl in d["controls"]:
-            findings_str = ", ".join(f"`{f}`" for f in ctrl["findings"]) or "—"
-            lines.append(f"| `{ctrl['sscf_control_id']}` | {ctrl['title']} | {findings_str} | {ctrl['worst_status']} |")
+            cid, title, findings, worst = ctrl["sscf_control_id"], ctrl["title"], ctrl["findings"], ctrl["worst_status"]
+            findings_str = ", ".join(f"`{f}`" for f in findings) or "—"
+            add(f"| `{cid}` | {title} | {findings_str} | {worst} |")
 
     lines.append("")
     return "\n".join(lines)
@@ -321,26 +340,24 @@ def benchmark(
 
     report = run_benchmark(backlog, sscf_index, threshold)
 
-    click.echo(
-        f"  overall score: {int(report['overall_score'] * 100)}% — {report['overall_status'].upper()}",
-        err=True,
-    )
+    # One buffered write for the whole scorecard summary rather than a flush per domain
+    progress = [f"  overall score: {int(report['overall_score'] * 100)}% — {report['overall_status'].upper()}"]
     for d in report["domains"]:
         score_str = f"{int(d['score'] * 100)}%" if d["score"] is not None else "N/A"
-        click.echo(
-            f"    {d['domain']}: {score_str} [{d['status'].upper()}] ({d['pass']}P/{d['partial']}p/{d['fail']}F)",
-            err=True,
+        progress.append(
+            f"    {d['domain']}: {score_str} [{d['status'].upper()}] ({d['pass']}P/{d['partial']}p/{d['fail']}F)"
         )
+    click.echo("\n".join(progress), err=True)
 
     if output_format == "markdown":
         output = _to_markdown(report)
     else:
-        output = json.dumps(report, indent=2)
+        output = _to_json(report)
 
     if out:
         out_path = (repo_root / out).resolve()
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(output)
+        out_path.write_text(output, encoding="utf-8")
         click.echo(f"  wrote report → {out_path}", err=True)
     else:
         click.echo(output)
@@ -0,0 +1,102 @@
+"""
+Shared pytest fixtures.
+
+The dry-run pipeline steps are deterministic, so their outputs are built once per test
+session and handed to every test that needs them. Treat the returned paths as read-only.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+REPO = Path(__file__).parent.parent
+SBS_CONTROLS = REPO / "docs/oscal-salesforce-poc/generated/sbs_controls.json"
+CONTROL_MAPPING = REPO / "config/oscal-salesforce/control_mapping.yaml"
+SSCF_MAP = REPO / "config/oscal-salesforce/sbs_to_sscf_mapping.yaml"
+SSCF_INDEX = REPO / "config/sscf_control_index.yaml"
+
+
+@pytest.fixture(scope="session")
+def sbs_controls() -> dict[str, Any]:
+    """Parsed SBS controls catalog; skips when the generated catalog is absent."""
+    if not SBS_CONTROLS.exists():
+        pytest.skip(f"SBS controls catalog not found: {SBS_CONTROLS}")
+    return json.loads(SBS_CONTROLS.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def sscf_index() -> dict[str, Any]:
+    """Parsed SSCF control index."""
+    from scripts.oscal_gap_map import _load_yaml
+
+    return _load_yaml(SSCF_INDEX)
+
+
+@pytest.fixture(scope="session")
+def dry_run_gap_text() -> str:
+    """gap_analysis JSON text from `oscal-assess assess --dry-run --env dev --out -`."""
+    from skills.oscal_assess.oscal_assess import cli
+
+    result = CliRunner().invoke(cli, ["assess", "--dry-run", "--env", "dev", "--out", "-"])
+    assert result.exit_code == 0, f"oscal-assess failed:\n{result.stderr}"
+    assert result.stdout.lstrip().startswith("{"), "oscal-assess wrote no JSON to stdout"
+    return result.stdout
+
+
+@pytest.fixture(scope="session")
+def dry_run_gap_json(tmp_path_factory: pytest.TempPathFactory, dry_run_gap_text: str) -> Path:
+    """The dry-run gap analysis on disk, for steps that take a --gap-analysis path."""
+    gap_json = tmp_path_factory.mktemp("gap") / "gap_analysis.json"
+    gap_json.write_text(dry_run_gap_text)
+    return gap_json
+
+
+@pytest.fixture(scope="session")
+def backlog_json(tmp_path_factory: pytest.TempPathFactory, dry_run_gap_json: Path) -> Path:
+    """backlog.json from scripts/oscal_gap_map.py run over the dry-run gap analysis."""
+    from scripts.oscal_gap_map import main as gap_map_main
+
+    if not SBS_CONTROLS.exists():
+        pytest.skip(f"SBS controls catalog not found: {SBS_CONTROLS}")
+
+    out_dir = tmp_path_factory.mktemp("backlog")
+    backlog = out_dir / "backlog.json"
+    exit_code = gap_map_main(
+        [
+            "--controls",
+            str(SBS_CONTROLS),
+            "--gap-analysis",
+            str(dry_run_gap_json),
+            "--mapping",
+            str(CONTROL_MAPPING),
+            "--sscf-map",
+            str(SSCF_MAP),
+            "--out-md",
+            str(out_dir / "matrix.md"),
+            "--out-json",
+            str(backlog),
+        ]
+    )
+    assert exit_code == 0, "oscal_gap_map.py failed"
+    assert backlog.exists(), "backlog.json not written"
+    return backlog
+
+
+@pytest.fixture(scope="session")
+def sscf_report_json(tmp_path_factory: pytest.TempPathFactory, backlog_json: Path) -> Path:
+    """sscf_report.json from `sscf-benchmark benchmark` over the dry-run backlog."""
+    from skills.sscf_benchmark.sscf_benchmark import cli
+
+    sscf_json = tmp_path_factory.mktemp("sscf") / "sscf_report.json"
+    result = CliRunner().invoke(
+        cli,
+        ["benchmark", "--backlog", str(backlog_json), "--sscf-index", str(SSCF_INDEX), "--out", str(sscf_json)],
+    )
+    assert result.exit_code == 0, f"sscf-benchmark failed:\n{result.output}"
+    assert sscf_json.exists(), "sscf_report.json not written"
+    return sscf_json
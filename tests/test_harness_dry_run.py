@@ -16,54 +16,96 @@ Mock sequence:
 from __future__ import annotations
 
 import json
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+import pytest
 from click.testing import CliRunner
 
 from harness.loop import cli
 
 _REPO = Path(__file__).parent.parent
 
+# Scripted tool inputs and the default dispatch result, shared across tests
+_SFDC_INPUT = {"scope": "all", "dry_run": True, "env": "dev", "org": "test-org"}
+_SFDC_ERR_INPUT = {"scope": "all", "dry_run": True}
+_OSCAL_INPUT = {"dry_run": True, "env": "dev"}
+_OK_DISPATCH_RESULT = json.dumps({"status": "ok"})
 
 # ---------------------------------------------------------------------------
-# Helpers — build realistic mock OpenAI ChatCompletion responses
+# Helpers — build realistic fake OpenAI ChatCompletion responses
 # ---------------------------------------------------------------------------
 
 
-def _tool_use_response(tool_name: str, tool_id: str, tool_input: dict) -> MagicMock:
-    """Build a mock OpenAI ChatCompletion with a tool_calls finish_reason."""
-    tc = MagicMock()
-    tc.id = tool_id
-    tc.function.name = tool_name
-    tc.function.arguments = json.dumps(tool_input)
+def _tool_use_response(tool_name: str, tool_id: str, tool_input: dict) -> SimpleNamespace:
+    """Build a fake OpenAI ChatCompletion with a tool_calls finish_reason.
 
-    msg = MagicMock()
-    msg.content = None
-    msg.tool_calls = [tc]
+    Plain SimpleNamespace objects carry exactly the ChatCompletion fields the loop reads —
+    a missing field raises AttributeError instead of silently returning a child mock. Each
+    call builds a fresh tree, so no scripted turn shares state with another.
+    """
+    tc = SimpleNamespace(
+        id=tool_id, type="function", function=SimpleNamespace(name=tool_name, arguments=json.dumps(tool_input))
+    )
+    msg = SimpleNamespace(role="assistant", content=None, tool_calls=[tc])
+    choice = SimpleNamespace(finish_reason="tool_calls", message=msg)
+    return SimpleNamespace(choices=[choice])
+
+
+def _end_turn_response(text: str) -> SimpleNamespace:
+    """Build a fake OpenAI ChatCompletion with a stop finish_reason."""
+    msg = SimpleNamespace(role="assistant", content=text, tool_calls=None)
+    choice = SimpleNamespace(finish_reason="stop", message=msg)
+    return SimpleNamespace(choices=[choice])
+
+
+def _scripted(*responses: SimpleNamespace) -> Callable[..., SimpleNamespace]:
+    """side_effect that returns each scripted turn once, in order.
+
+    An unexpected extra call fails with IndexError: pop from an empty deque.
+    """
+    turns = deque(responses)
+    return lambda *_a, **_kw: turns.popleft()
+
+
+# ---------------------------------------------------------------------------
+# Fixtures — shared CLI runner and harness collaborators replaced with mocks
+# ---------------------------------------------------------------------------
 
-    choice = MagicMock()
-    choice.finish_reason = "tool_calls"
-    choice.message = msg
 
-    response = MagicMock()
-    response.choices = [choice]
-    return response
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """One CliRunner for the module; stdout and stderr are captured separately (Click >= 8.2)."""
+    return CliRunner()
 
 
-def _end_turn_response(text: str) -> MagicMock:
-    """Build a mock OpenAI ChatCompletion with a stop finish_reason."""
-    msg = MagicMock()
-    msg.content = text
-    msg.tool_calls = None
+@pytest.fixture
+def patched_harness(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the harness's LLM client factory and memory/dispatch collaborators with mocks.
 
-    choice = MagicMock()
-    choice.finish_reason = "stop"
-    choice.message = msg
+    Tests script the turn sequence via client.chat.completions.create.side_effect and
+    override return_value / side_effect on the other mocks as needed.
+    """
+    import harness.loop
 
-    response = MagicMock()
-    response.choices = [choice]
-    return response
+    client = MagicMock()
+    mocks = SimpleNamespace(
+        client=client,
+        build_openai_client=MagicMock(return_value=client),
+        build_client=MagicMock(return_value=MagicMock()),
+        load_memories=MagicMock(return_value=""),
+        save_assessment=MagicMock(),
+        dispatch=MagicMock(return_value=_OK_DISPATCH_RESULT),
+    )
+    monkeypatch.setattr(harness.loop, "_build_openai_client", mocks.build_openai_client)
+    monkeypatch.setattr(harness.loop, "build_client", mocks.build_client)
+    monkeypatch.setattr(harness.loop, "load_memories", mocks.load_memories)
+    monkeypatch.setattr(harness.loop, "save_assessment", mocks.save_assessment)
+    monkeypatch.setattr(harness.loop, "dispatch", mocks.dispatch)
+    return mocks
 
 
 # ---------------------------------------------------------------------------
@@ -71,51 +113,20 @@ def _end_turn_response(text: str) -> MagicMock:
 # ---------------------------------------------------------------------------
 
 
-def test_dry_run_loop_tool_dispatch_order(tmp_path: Path) -> None:
+@pytest.mark.xdist_group("pipeline")
+def test_dry_run_loop_tool_dispatch_order(
+    runner: CliRunner, patched_harness: SimpleNamespace, tmp_path: Path, dry_run_gap_json: Path
+) -> None:
     """Loop calls tools in correct order and exits cleanly."""
 
-    fake_gap = str(tmp_path / "gap_analysis.json")
-
-    # Write minimal gap_analysis.json so _extract_critical_fails / _extract_score work
-    (tmp_path / "gap_analysis.json").write_text(
-        json.dumps(
-            {
-                "assessment_id": "test-001",
-                "findings": [
-                    {"control_id": "SBS-AUTH-001", "status": "fail", "severity": "critical"},
-                    {"control_id": "SBS-ACS-001", "status": "fail", "severity": "high"},
-                ],
-            }
-        )
-    )
-    (tmp_path / "sscf_report.json").write_text(
-        json.dumps(
-            {
-                "benchmark_id": "bench-001",
-                "overall_score": 0.34,
-                "overall_status": "red",
-                "domains": [],
-                "summary": {"domains_green": 0, "domains_red": 7},
-            }
-        )
-    )
+    # The loop only reads the gap analysis (for critical fails), so the shared session artifact is used read-only
+    fake_gap = str(dry_run_gap_json)
 
-    mock_responses = [
-        _tool_use_response(
-            "sfdc_connect_collect",
-            "call_001",
-            {"scope": "all", "dry_run": True, "env": "dev", "org": "test-org"},
-        ),
-        _tool_use_response(
-            "oscal_assess_assess",
-            "call_002",
-            {"dry_run": True, "env": "dev", "out": fake_gap},
-        ),
+    patched_harness.client.chat.completions.create.side_effect = _scripted(
+        _tool_use_response("sfdc_connect_collect", "call_001", _SFDC_INPUT),
+        _tool_use_response("oscal_assess_assess", "call_002", {**_OSCAL_INPUT, "out": fake_gap}),
         _end_turn_response("Assessment complete. overall_score=34%, status=RED."),
-    ]
-
-    mock_openai_client = MagicMock()
-    mock_openai_client.chat.completions.create.side_effect = mock_responses
+    )
 
     sfdc_out = str(tmp_path / "sfdc_raw.json")
     dispatch_results = {
@@ -124,39 +135,31 @@ def test_dry_run_loop_tool_dispatch_order(tmp_path: Path) -> None:
     }
 
     def fake_dispatch(name: str, inp: dict) -> str:  # noqa: ANN001
-        return dispatch_results.get(name, json.dumps({"status": "ok"}))
+        return dispatch_results.get(name, _OK_DISPATCH_RESULT)
 
-    runner = CliRunner()
+    patched_harness.load_memories.return_value = "No prior assessments."
+    patched_harness.dispatch.side_effect = fake_dispatch
 
-    with (
-        patch("openai.OpenAI", return_value=mock_openai_client),
-        patch("harness.loop.build_client") as mock_build,
-        patch("harness.loop.load_memories", return_value="No prior assessments."),
-        patch("harness.loop.save_assessment") as mock_save,
-        patch("harness.loop.dispatch", side_effect=fake_dispatch) as mock_dispatch,
-    ):
-        mock_build.return_value = MagicMock()
-
-        result = runner.invoke(
-            cli,
-            ["run", "--dry-run", "--env", "dev", "--org", "test-org", "--approve-critical"],
-        )
+    result = runner.invoke(
+        cli,
+        ["run", "--dry-run", "--env", "dev", "--org", "test-org", "--approve-critical"],
+    )
 
     assert result.exit_code == 0, f"Loop exited with {result.exit_code}:\n{result.output}"
 
     # Verify tool dispatch order
-    dispatch_calls = mock_dispatch.call_args_list
+    dispatch_calls = patched_harness.dispatch.call_args_list
     assert len(dispatch_calls) == 2, f"Expected 2 dispatch calls, got {len(dispatch_calls)}"
     assert dispatch_calls[0][0][0] == "sfdc_connect_collect"
     assert dispatch_calls[1][0][0] == "oscal_assess_assess"
 
-    # Verify dry_run propagated to tool inputs
-    assert dispatch_calls[0][0][1].get("dry_run") is True
-    assert dispatch_calls[1][0][1].get("dry_run") is True
+    # Verify tool inputs (including dry_run) reach dispatch unchanged
+    assert dispatch_calls[0][0][1] == _SFDC_INPUT
+    assert dispatch_calls[1][0][1] == {**_OSCAL_INPUT, "out": fake_gap}
 
     # Verify memory save was called
-    mock_save.assert_called_once()
-    save_args = mock_save.call_args[0]
+    patched_harness.save_assessment.assert_called_once()
+    save_args = patched_harness.save_assessment.call_args[0]
     assert save_args[1] == "test-org"  # org_alias
 
 
@@ -165,30 +168,21 @@ def test_dry_run_loop_tool_dispatch_order(tmp_path: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_tool_error_triggers_handler(tmp_path: Path) -> None:
+def test_tool_error_triggers_handler(
+    runner: CliRunner, patched_harness: SimpleNamespace, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """When dispatch raises, _handle_tool_error is called."""
-    mock_responses = [
-        _tool_use_response("sfdc_connect_collect", "call_err", {"scope": "all", "dry_run": True}),
+    import harness.loop
+
+    patched_harness.client.chat.completions.create.side_effect = _scripted(
+        _tool_use_response("sfdc_connect_collect", "call_err", _SFDC_ERR_INPUT),
         _end_turn_response("Halted due to tool error."),
-    ]
-
-    mock_client = MagicMock()
-    mock_client.chat.completions.create.side_effect = mock_responses
-
-    runner = CliRunner()
-
-    with (
-        patch("openai.OpenAI", return_value=mock_client),
-        patch("harness.loop.build_client", return_value=MagicMock()),
-        patch("harness.loop.load_memories", return_value=""),
-        patch("harness.loop.save_assessment"),
-        patch("harness.loop.dispatch", side_effect=RuntimeError("Salesforce connection refused")),
-        patch(
-            "harness.loop._handle_tool_error",
-            return_value='{"status": "error", "message": "handled"}',
-        ) as mock_handler,
-    ):
-        runner.invoke(cli, ["run", "--dry-run", "--org", "err-org"])
+    )
+    patched_harness.dispatch.side_effect = RuntimeError("Salesforce connection refused")
+    mock_handler = MagicMock(return_value='{"status": "error", "message": "handled"}')
+    monkeypatch.setattr(harness.loop, "_handle_tool_error", mock_handler)
+
+    runner.invoke(cli, ["run", "--dry-run", "--org", "err-org"])
 
     mock_handler.assert_called_once()
     call_args = mock_handler.call_args[0]
@@ -197,27 +191,18 @@ def test_tool_error_triggers_handler(tmp_path: Path) -> None:
 
 
 # ---------------------------------------------------------------------------
-# Test: OpenAI client constructed with env key
+# Test: OpenAI client constructed with the given key
 # ---------------------------------------------------------------------------
 
 
-def test_openai_client_uses_api_key(tmp_path: Path) -> None:
-    """OPENAI_API_KEY env var is passed to the OpenAI client."""
-    mock_responses = [_end_turn_response("No tools needed.")]
-    mock_client = MagicMock()
-    mock_client.chat.completions.create.side_effect = mock_responses
+def test_openai_client_uses_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The explicit API key is passed to the OpenAI client, with retries enabled."""
+    import openai
 
-    runner = CliRunner()
+    from harness.loop import _build_openai_client
 
-    with (
-        patch("openai.OpenAI", return_value=mock_client) as mock_ctor,
-        patch("harness.loop.build_client", return_value=MagicMock()),
-        patch("harness.loop.load_memories", return_value=""),
-        patch("harness.loop.save_assessment"),
-    ):
-        runner.invoke(
-            cli,
-            ["run", "--dry-run", "--org", "key-test-org", "--api-key", "sk-test-key"],
-        )
+    mock_ctor = MagicMock()
+    monkeypatch.setattr(openai, "OpenAI", mock_ctor)
 
+    assert _build_openai_client("sk-test-key") is mock_ctor.return_value
     mock_ctor.assert_called_once_with(api_key="sk-test-key", max_retries=5)
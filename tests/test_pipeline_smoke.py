@@ -3,21 +3,18 @@
 oscal-assess --dry-run → oscal_gap_map.py → sscf-benchmark
 
 All three steps must produce valid JSON with expected top-level keys.
+
+Each step runs once per session (see the fixtures in conftest.py) and every test below
+asserts on that shared artifact, so a failure still points at the stage that broke.
 """
 
 import json
-import subprocess
-import sys
 from pathlib import Path
 
 import pytest
 
-REPO = Path(__file__).parent.parent
-PYTHON = sys.executable
-
-
-def _run(*args: str, cwd: Path = REPO, check: bool = True) -> subprocess.CompletedProcess:
-    return subprocess.run(list(args), capture_output=True, text=True, cwd=cwd, check=check)
+# Keep the pipeline on one xdist worker so the session-scoped artifacts are built only once
+pytestmark = pytest.mark.xdist_group("pipeline")
 
 
 # ---------------------------------------------------------------------------
@@ -25,23 +22,8 @@ def _run(*args: str, cwd: Path = REPO, check: bool = True) -> subprocess.Complet
 # ---------------------------------------------------------------------------
 
 
-def test_oscal_assess_dry_run_produces_valid_json(tmp_path: Path) -> None:
-    gap_json = tmp_path / "gap_analysis.json"
-    result = _run(
-        PYTHON,
-        "-m",
-        "skills.oscal_assess.oscal_assess",
-        "assess",
-        "--dry-run",
-        "--env",
-        "dev",
-        "--out",
-        str(gap_json),
-    )
-    assert result.returncode == 0, f"oscal-assess failed:\n{result.stderr}"
-    assert gap_json.exists(), "gap_analysis.json not written"
-
-    data = json.loads(gap_json.read_text())
+def test_oscal_assess_dry_run_produces_valid_json(dry_run_gap_text: str) -> None:
+    data = json.loads(dry_run_gap_text)
     assert "assessment_id" in data
     assert "findings" in data
     # Issue #11: data_source and AI notice must be present
@@ -80,51 +62,8 @@ def test_oscal_assess_dry_run_produces_valid_json(tmp_path: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_gap_map_produces_backlog(tmp_path: Path) -> None:
-    gap_json = tmp_path / "gap_analysis.json"
-    backlog_json = tmp_path / "backlog.json"
-    matrix_md = tmp_path / "matrix.md"
-
-    # First generate gap analysis
-    _run(
-        PYTHON,
-        "-m",
-        "skills.oscal_assess.oscal_assess",
-        "assess",
-        "--dry-run",
-        "--env",
-        "dev",
-        "--out",
-        str(gap_json),
-    )
-
-    controls_path = REPO / "docs/oscal-salesforce-poc/generated/sbs_controls.json"
-    mapping_path = REPO / "config/oscal-salesforce/control_mapping.yaml"
-    sscf_map_path = REPO / "config/oscal-salesforce/sbs_to_sscf_mapping.yaml"
-
-    if not controls_path.exists():
-        pytest.skip(f"SBS controls catalog not found: {controls_path}")
-
-    result = _run(
-        PYTHON,
-        "scripts/oscal_gap_map.py",
-        "--controls",
-        str(controls_path),
-        "--gap-analysis",
-        str(gap_json),
-        "--mapping",
-        str(mapping_path),
-        "--sscf-map",
-        str(sscf_map_path),
-        "--out-md",
-        str(matrix_md),
-        "--out-json",
-        str(backlog_json),
-    )
-    assert result.returncode == 0, f"oscal_gap_map.py failed:\n{result.stderr}"
-    assert backlog_json.exists(), "backlog.json not written"
-
-    data = json.loads(backlog_json.read_text())
+def test_gap_map_produces_backlog(backlog_json: Path, sbs_controls: dict) -> None:
+    data = json.loads(backlog_json.read_bytes())
     assert "assessment_id" in data
     assert "mapped_items" in data
     assert len(data["mapped_items"]) > 0
@@ -136,70 +75,19 @@ def test_gap_map_produces_backlog(tmp_path: Path) -> None:
     confidences = {item.get("mapping_confidence") for item in data["mapped_items"]}
     assert len(confidences) > 1, f"Expected mapping_confidence variance, got uniform: {confidences}"
 
+    # Every mapped item must resolve to a control in the imported catalog
+    catalog_ids = {c["control_id"] for c in sbs_controls["controls"]}
+    unknown = {item["sbs_control_id"] for item in data["mapped_items"]} - catalog_ids
+    assert not unknown, f"Backlog references controls missing from the catalog: {sorted(unknown)}"
+
 
 # ---------------------------------------------------------------------------
 # Step 3 — sscf-benchmark
 # ---------------------------------------------------------------------------
 
 
-def test_sscf_benchmark_produces_scorecard(tmp_path: Path) -> None:
-    gap_json = tmp_path / "gap_analysis.json"
-    backlog_json = tmp_path / "backlog.json"
-    matrix_md = tmp_path / "matrix.md"
-    sscf_json = tmp_path / "sscf_report.json"
-
-    controls_path = REPO / "docs/oscal-salesforce-poc/generated/sbs_controls.json"
-    mapping_path = REPO / "config/oscal-salesforce/control_mapping.yaml"
-    sscf_map_path = REPO / "config/oscal-salesforce/sbs_to_sscf_mapping.yaml"
-    sscf_index_path = REPO / "config/sscf_control_index.yaml"
-
-    if not controls_path.exists():
-        pytest.skip(f"SBS controls catalog not found: {controls_path}")
-
-    _run(
-        PYTHON,
-        "-m",
-        "skills.oscal_assess.oscal_assess",
-        "assess",
-        "--dry-run",
-        "--env",
-        "dev",
-        "--out",
-        str(gap_json),
-    )
-    _run(
-        PYTHON,
-        "scripts/oscal_gap_map.py",
-        "--controls",
-        str(controls_path),
-        "--gap-analysis",
-        str(gap_json),
-        "--mapping",
-        str(mapping_path),
-        "--sscf-map",
-        str(sscf_map_path),
-        "--out-md",
-        str(matrix_md),
-        "--out-json",
-        str(backlog_json),
-    )
-
-    result = _run(
-        PYTHON,
-        "-m",
-        "skills.sscf_benchmark.sscf_benchmark",
-        "benchmark",
-        "--backlog",
-        str(backlog_json),
-        "--sscf-index",
-        str(sscf_index_path),
-        "--out",
-        str(sscf_json),
-    )
-    assert result.returncode == 0, f"sscf-benchmark failed:\n{result.stderr}"
-    assert sscf_json.exists(), "sscf_report.json not written"
-
-    data = json.loads(sscf_json.read_text())
+def test_sscf_benchmark_produces_scorecard(sscf_report_json: Path, sscf_index: dict) -> None:
+    data = json.loads(sscf_report_json.read_bytes())
     assert "benchmark_id" in data
     assert "overall_score" in data
     assert "overall_status" in data
@@ -207,6 +95,8 @@ def test_sscf_benchmark_produces_scorecard(tmp_path: Path) -> None:
     assert data["overall_status"] in {"green", "amber", "red"}
     # SSCF v1.0 has 6 domains: CON/DSP/IAM/IPY/LOG/SEF (TDR/GOV merged into SEF in v1.0)
     assert len(data["domains"]) == 6, f"Expected 6 SSCF domains, got {len(data['domains'])}"
+    index_domains = {c["domain"] for c in sscf_index["controls"]}
+    assert {d["domain"] for d in data["domains"]} <= index_domains
 
     # Dry-run weak org should score below threshold (0.80)
     assert data["overall_score"] < 0.80, f"Expected weak-org score < 0.80, got {data['overall_score']}"
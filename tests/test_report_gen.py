@@ -5,6 +5,8 @@ Exercises three output variants:
 - security audience Markdown with SSCF domain heatmap
 - app-owner DOCX (validated as a real Office Open XML ZIP)
 
+plus in-process unit tests for the Markdown table helpers.
+
 Uses the real salesforce_oscal_backlog_latest.json already in the repo.
 All tests are skipped if that file is not present (matches pipeline smoke pattern).
 """
@@ -12,7 +14,9 @@ All tests are skipped if that file is not present (matches pipeline smoke patter
 import shutil
 import subprocess
 import sys
+import zipfile
 from pathlib import Path
+from xml.etree import ElementTree
 
 import pytest
 
@@ -20,53 +24,33 @@ REPO = Path(__file__).parent.parent
 PYTHON = sys.executable
 
 _BACKLOG = REPO / "docs" / "oscal-salesforce-poc" / "generated" / "salesforce_oscal_backlog_latest.json"
-_SSCF_INDEX = REPO / "config" / "sscf_control_index.yaml"
-_CONTROLS = REPO / "docs" / "oscal-salesforce-poc" / "generated" / "sbs_controls.json"
-_MAPPING = REPO / "config" / "oscal-salesforce" / "control_mapping.yaml"
-_SSCF_MAP = REPO / "config" / "oscal-salesforce" / "sbs_to_sscf_mapping.yaml"
-
-
-def _run(*args: str, cwd: Path = REPO, check: bool = True) -> subprocess.CompletedProcess:
-    return subprocess.run(list(args), capture_output=True, text=True, cwd=cwd, check=check)
 
+# ECMA-376 CT_TblPr child order, split around tblBorders
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_TBL_PR_BEFORE_BORDERS = {
+    f"{_W}{tag}"
+    for tag in (
+        "tblStyle",
+        "tblpPr",
+        "tblOverlap",
+        "bidiVisual",
+        "tblStyleRowBandSize",
+        "tblStyleColBandSize",
+        "tblW",
+        "jc",
+        "tblCellSpacing",
+        "tblInd",
+    )
+}
+_TBL_PR_AFTER_BORDERS = {
+    f"{_W}{tag}" for tag in ("shd", "tblLayout", "tblCellMar", "tblLook", "tblCaption", "tblDescription", "tblPrChange")
+}
 
-def _make_sscf_report(tmp_path: Path) -> Path:
-    """Generate a fresh sscf_report.json via the pipeline for use in security audience tests."""
-    gap = tmp_path / "gap.json"
-    backlog = tmp_path / "backlog.json"
-    matrix = tmp_path / "matrix.md"
-    sscf = tmp_path / "sscf_report.json"
 
-    _run(PYTHON, "-m", "skills.oscal_assess.oscal_assess", "assess", "--dry-run", "--env", "dev", "--out", str(gap))
-    _run(
-        PYTHON,
-        "scripts/oscal_gap_map.py",
-        "--controls",
-        str(_CONTROLS),
-        "--gap-analysis",
-        str(gap),
-        "--mapping",
-        str(_MAPPING),
-        "--sscf-map",
-        str(_SSCF_MAP),
-        "--out-md",
-        str(matrix),
-        "--out-json",
-        str(backlog),
-    )
-    _run(
-        PYTHON,
-        "-m",
-        "skills.sscf_benchmark.sscf_benchmark",
-        "benchmark",
-        "--backlog",
-        str(backlog),
-        "--sscf-index",
-        str(_SSCF_INDEX),
-        "--out",
-        str(sscf),
-    )
-    return sscf
+def _run(*args: str, log_dir: Path, cwd: Path = REPO) -> subprocess.CompletedProcess:
+    """Run a pipeline step, streaming its output to stdout.log/stderr.log in log_dir; callers check returncode."""
+    with (log_dir / "stdout.log").open("ab") as stdout, (log_dir / "stderr.log").open("ab") as stderr:
+        return subprocess.run(list(args), stdout=stdout, stderr=stderr, cwd=cwd, check=False)
 
 
 # ---------------------------------------------------------------------------
@@ -91,8 +75,9 @@ def test_app_owner_md(tmp_path: Path) -> None:
         "--out",
         str(out),
         "--mock-llm",
+        log_dir=tmp_path,
     )
-    assert result.returncode == 0, f"report-gen failed:\n{result.stderr}"
+    assert result.returncode == 0, f"report-gen failed, see {tmp_path}/stderr.log"
     assert out.exists(), "Markdown report not written"
 
     content = out.read_text()
@@ -109,13 +94,11 @@ def test_app_owner_md(tmp_path: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_security_md(tmp_path: Path) -> None:
+@pytest.mark.xdist_group("pipeline")
+def test_security_md(tmp_path: Path, sscf_report_json: Path) -> None:
     if not _BACKLOG.exists():
         pytest.skip(f"backlog file not found: {_BACKLOG}")
-    if not _CONTROLS.exists():
-        pytest.skip(f"controls catalog not found: {_CONTROLS}")
 
-    sscf_report = _make_sscf_report(tmp_path)
     out = tmp_path / "report_security.md"
 
     result = _run(
@@ -130,10 +113,11 @@ def test_security_md(tmp_path: Path) -> None:
         "--out",
         str(out),
         "--sscf-benchmark",
-        str(sscf_report),
+        str(sscf_report_json),
         "--mock-llm",
+        log_dir=tmp_path,
     )
-    assert result.returncode == 0, f"report-gen (security) failed:\n{result.stderr}"
+    assert result.returncode == 0, f"report-gen (security) failed, see {tmp_path}/stderr.log"
     assert out.exists(), "Security Markdown report not written"
 
     content = out.read_text()
@@ -171,11 +155,86 @@ def test_docx_created(tmp_path: Path) -> None:
         "--out",
         str(out),
         "--mock-llm",
+        log_dir=tmp_path,
     )
-    assert result.returncode == 0, f"report-gen (docx) failed:\n{result.stderr}"
+    assert result.returncode == 0, f"report-gen (docx) failed, see {tmp_path}/stderr.log"
     docx_out = out.with_suffix(".docx")
     assert docx_out.exists(), "DOCX report not written"
     assert docx_out.stat().st_size > 0, "DOCX file is empty"
     # DOCX is a ZIP — verify magic bytes (PK header)
     header = docx_out.read_bytes()[:4]
     assert header == b"PK\x03\x04", f"Output is not a valid DOCX/ZIP: {header!r}"
+
+    # Every table carries exactly one tblBorders, placed where the schema requires it
+    with zipfile.ZipFile(docx_out) as docx:
+        document = ElementTree.fromstring(docx.read("word/document.xml"))
+    tbl_prs = document.findall(f".//{_W}tbl/{_W}tblPr")
+    assert tbl_prs, "DOCX contains no tables"
+    for tbl_pr in tbl_prs:
+        tags = [child.tag for child in tbl_pr]
+        assert tags.count(f"{_W}tblBorders") == 1, f"Expected one tblBorders in tblPr, got {tags}"
+        split = tags.index(f"{_W}tblBorders")
+        assert set(tags[:split]) <= _TBL_PR_BEFORE_BORDERS, f"tblBorders out of schema order: {tags}"
+        assert set(tags[split + 1 :]) <= _TBL_PR_AFTER_BORDERS, f"tblBorders out of schema order: {tags}"
+
+
+# ---------------------------------------------------------------------------
+# Unit — Markdown table rendering
+# ---------------------------------------------------------------------------
+
+
+def test_md_row_escapes_pipes_in_cells() -> None:
+    from skills.report_gen.report_gen import _md_row
+
+    assert _md_row(["Allow A|B", 3, "plain"]) == "| Allow A\\|B | 3 | plain |"
+
+
+def test_full_matrix_escapes_pipes_in_finding_text() -> None:
+    from skills.report_gen.report_gen import _prepare_items, _render_full_matrix
+
+    items = [{"sbs_control_id": "SBS-ACS-001", "sbs_title": "Admins | integrations", "severity": "high"}]
+    _prepare_items(items)
+    lines = list(_render_full_matrix(items))
+
+    row = next(line for line in lines if "SBS-ACS-001" in line)
+    assert "Admins \\| integrations" in row
+    # 7 columns → 8 unescaped delimiters
+    assert row.replace("\\|", "").count("|") == 8
+
+
+def test_full_matrix_empty_backlog_renders_nothing() -> None:
+    from skills.report_gen.report_gen import _render_full_matrix
+
+    assert list(_render_full_matrix([])) == []
+
+
+def test_write_markdown_skips_empty_sections(tmp_path: Path) -> None:
+    from skills.report_gen.report_gen import _write_markdown
+
+    out = tmp_path / "report.md"
+    _write_markdown(out, ["# Title", "", iter(()), ["## Section", "", "body"]])
+
+    assert out.read_text(encoding="utf-8") == "# Title\n\n## Section\n\nbody"
+
+
+# ---------------------------------------------------------------------------
+# Unit — background LLM call
+# ---------------------------------------------------------------------------
+
+
+def test_start_llm_returns_mock_narrative() -> None:
+    from skills.report_gen.report_gen import _MOCK_TEMPLATES, _start_llm
+
+    future = _start_llm("For the Security Team", "msg", "model", mock=True)
+    assert future.result(timeout=5) == _MOCK_TEMPLATES["security"]
+
+
+def test_start_llm_reraises_exit_from_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    from skills.report_gen import report_gen
+
+    def _missing_key(*_args: object) -> str:
+        raise SystemExit(1)
+
+    monkeypatch.setattr(report_gen, "_call_llm", _missing_key)
+    with pytest.raises(SystemExit):
+        report_gen._start_llm("system", "msg", "model").result(timeout=5)
@@ -0,0 +1,205 @@
+"""
+Unit tests for the sfdc-connect collect command.
+No live Salesforce org required — the client is replaced with an in-memory fake.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from click.testing import CliRunner
+
+
+class _FakeSalesforce:
+    """Minimal stand-in for simple_salesforce.Salesforce — answers every query with one record."""
+
+    sf_version = "59.0"
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.fail_on = fail_on
+        self.fail_message = "boom"
+        self.sf_instance = "fake.my.salesforce.com"
+        self.calls: list[str] = []
+
+    def query_all(self, soql: str) -> dict[str, Any]:
+        self.calls.append("query_all")
+        if self.fail_on and self.fail_on in soql:
+            raise RuntimeError(f"{self.fail_message}: {self.fail_on}")
+        return {"totalSize": 1, "done": True, "records": [{"soql": soql}]}
+
+    def limits(self) -> dict[str, Any]:
+        self.calls.append("limits")
+        return {"DailyApiRequests": {"Max": 15000, "Remaining": 14999}}
+
+    def restful(self, path: str, params: dict | None = None, method: str = "GET", **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(path)
+        if path == "composite/batch":
+            results = []
+            for sub in kwargs["json"]["batchRequests"]:
+                soql = parse_qs(urlsplit(sub["url"]).query)["q"][0]
+                if self.fail_on and self.fail_on in soql:
+                    results.append({"statusCode": 400, "result": [{"errorCode": "INVALID_TYPE"}]})
+                else:
+                    results.append({"statusCode": 200, "result": {"totalSize": 1, "done": True, "records": [soql]}})
+            return {"hasErrors": any(r["statusCode"] >= 400 for r in results), "batchResults": results}
+        return {"totalSize": 1, "records": [{"path": path, "params": params}]}
+
+
+@pytest.fixture
+def fake_sf(monkeypatch, tmp_path):
+    from skills.sfdc_connect import sfdc_connect
+
+    sf = _FakeSalesforce()
+    monkeypatch.setattr(sfdc_connect, "_connect", lambda *_a, **_kw: sf)
+    monkeypatch.setattr(sfdc_connect, "QUERY_CACHE_DIR", tmp_path / "query-cache")
+    monkeypatch.setattr(sfdc_connect, "_unavailable_queries", {})
+    return sf
+
+
+def test_collect_all_scopes_in_declared_order(fake_sf, tmp_path):
+    """collect --scope all returns every scope, keyed in SCOPE_COLLECTORS order."""
+    from skills.sfdc_connect.sfdc_connect import SCOPE_COLLECTORS, cli
+
+    out = tmp_path / "sfdc_raw.json"
+    result = CliRunner().invoke(cli, ["collect", "--scope", "all", "--out", str(out)])
+    assert result.exit_code == 0, result.output
+
+    raw = json.loads(out.read_bytes())["raw"]
+    assert list(raw) == list(SCOPE_COLLECTORS)
+    assert raw["access"]["admin_profiles"]["totalSize"] == 1
+
+
+def test_collect_scope_failure_is_isolated(fake_sf, tmp_path):
+    """A collector that raises is recorded as an error without affecting the other scopes."""
+    from skills.sfdc_connect.sfdc_connect import cli
+
+    fake_sf.fail_on = "FROM NamedCredential"
+    out = tmp_path / "sfdc_raw.json"
+    result = CliRunner().invoke(cli, ["collect", "--scope", "all", "--out", str(out)])
+    assert result.exit_code == 0, result.output
+
+    raw = json.loads(out.read_bytes())["raw"]
+    assert "boom" in raw["integrations"]["error"]
+    assert "error" not in raw["access"]
+
+
+def test_collector_query_fallback_keeps_other_queries(fake_sf):
+    """Within a scope, a failing optional query falls back while its siblings still return data."""
+    from skills.sfdc_connect.sfdc_connect import collect_auth
+
+    fake_sf.fail_on = "FROM SamlSsoConfig"
+    data = collect_auth(fake_sf)
+
+    assert list(data) == ["session_settings", "mfa_org_settings", "sso_providers", "login_ip_ranges", "mfa_policies"]
+    assert data["sso_providers"] == {"totalSize": 0, "records": []}
+    assert data["login_ip_ranges"]["totalSize"] == 1
+
+
+def test_collector_uses_one_composite_batch_round_trip(fake_sf):
+    """A multi-query scope is fetched with a single composite/batch POST when every subrequest succeeds."""
+    from skills.sfdc_connect.sfdc_connect import collect_access
+
+    data = collect_access(fake_sf)
+
+    assert fake_sf.calls == ["composite/batch"]
+    assert list(data) == ["admin_profiles", "elevated_permission_sets", "connected_apps"]
+    assert "FROM Profile" in data["admin_profiles"]["records"][0]
+
+
+def test_collect_reuses_cached_query_results(fake_sf, tmp_path):
+    """With --cache-ttl, a second collect is served from the disk cache and flagged; --no-cache bypasses it."""
+    from skills.sfdc_connect.sfdc_connect import cli
+
+    out = tmp_path / "sfdc_raw.json"
+    args = ["collect", "--scope", "access", "--out", str(out), "--cache-ttl", "300"]
+    first = CliRunner().invoke(cli, args)
+    assert first.exit_code == 0, first.output
+    assert fake_sf.calls == ["composite/batch"]
+    assert json.loads(out.read_bytes())["cached_scopes"] == {}
+
+    fake_sf.calls.clear()
+    second = CliRunner().invoke(cli, args)
+    assert second.exit_code == 0, second.output
+    assert fake_sf.calls == []
+    envelope = json.loads(out.read_bytes())
+    assert envelope["raw"]["access"]["admin_profiles"]["totalSize"] == 1
+    assert list(envelope["cached_scopes"]) == ["access"]
+
+    third = CliRunner().invoke(cli, [*args, "--no-cache"])
+    assert third.exit_code == 0, third.output
+    assert fake_sf.calls == ["composite/batch"]
+    assert json.loads(out.read_bytes())["cached_scopes"] == {}
+
+
+def test_collect_does_not_cache_by_default(fake_sf, tmp_path):
+    """Without --cache-ttl every collect queries the org and nothing is written to the cache dir."""
+    from skills.sfdc_connect.sfdc_connect import cli
+
+    args = ["collect", "--scope", "access", "--out", str(tmp_path / "sfdc_raw.json")]
+    for _ in range(2):
+        result = CliRunner().invoke(cli, args)
+        assert result.exit_code == 0, result.output
+
+    assert fake_sf.calls == ["composite/batch", "composite/batch"]
+    assert not (tmp_path / "query-cache").exists()
+
+
+def test_query_cache_is_per_user_and_api_version(fake_sf, tmp_path, monkeypatch):
+    """Cached results are never replayed for a different running user or API version."""
+    from skills.sfdc_connect.sfdc_connect import QueryCache, collect_access
+
+    cache = QueryCache(tmp_path / "query-cache", ttl=300)
+    monkeypatch.setenv("SF_USERNAME", "admin@example.com")
+    collect_access(fake_sf, cache)
+
+    fake_sf.calls.clear()
+    monkeypatch.setenv("SF_USERNAME", "auditor@example.com")
+    collect_access(fake_sf, cache)
+    assert fake_sf.calls == ["composite/batch"]
+
+    fake_sf.calls.clear()
+    fake_sf.sf_version = "60.0"
+    collect_access(fake_sf, cache)
+    assert fake_sf.calls == ["composite/batch"]
+
+
+def test_org_info_fetches_organization_and_limits(fake_sf, tmp_path):
+    """org-info returns the organization record and limits under stable keys."""
+    from skills.sfdc_connect.sfdc_connect import cli
+
+    out = tmp_path / "org_info.json"
+    result = CliRunner().invoke(cli, ["org-info", "--out", str(out)])
+    assert result.exit_code == 0, result.output
+
+    raw = json.loads(out.read_bytes())["raw"]
+    assert list(raw) == ["organization", "limits"]
+    assert "FROM Organization" in raw["organization"]["records"][0]["soql"]
+    assert raw["limits"]["DailyApiRequests"]["Max"] == 15000
+
+
+def test_unsupported_optional_query_is_skipped_on_later_runs(fake_sf, tmp_path, monkeypatch):
+    """An optional query rejected with INVALID_TYPE is not re-sent, in-process or from the disk cache."""
+    from skills.sfdc_connect import sfdc_connect
+    from skills.sfdc_connect.sfdc_connect import QueryCache, collect_auth
+
+    fake_sf.fail_on = "FROM SamlSsoConfig"
+    fake_sf.fail_message = "INVALID_TYPE: sObject type 'SamlSsoConfig' is not supported"
+    cache = QueryCache(tmp_path / "query-cache", ttl=0)
+
+    first = collect_auth(fake_sf, cache)
+    assert first["sso_providers"] == {"totalSize": 0, "records": []}
+    assert fake_sf.calls == ["composite/batch", "query_all"]
+
+    # Same process: remembered in memory
+    fake_sf.calls.clear()
+    assert collect_auth(fake_sf, cache) == first
+    assert fake_sf.calls == ["composite/batch"]
+
+    # New process: remembered on disk
+    monkeypatch.setattr(sfdc_connect, "_unavailable_queries", {})
+    fake_sf.calls.clear()
+    assert collect_auth(fake_sf, cache) == first
+    assert fake_sf.calls == ["composite/batch"]
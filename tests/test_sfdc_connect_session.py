@@ -0,0 +1,120 @@
+"""
+Unit tests for sfdc-connect login session reuse.
+No live Salesforce org required — simple_salesforce.Salesforce is replaced with a fake.
+"""
+
+from __future__ import annotations
+
+import json
+import stat
+from typing import Any
+
+import pytest
+import requests
+
+
+class _FakeClient:
+    """Records how each client was built; a session_id of 'revoked' answers REST calls with an error."""
+
+    built: list[dict[str, Any]] = []
+
+    def __init__(self, **kwargs: Any) -> None:
+        _FakeClient.built.append(kwargs)
+        self.session = requests.Session()
+        self.sf_instance = "fake.my.salesforce.com"
+        self.sf_version = kwargs.get("version", "59.0")
+        self.session_id = kwargs.get("session_id", "fresh-session")
+
+    def restful(self, path: str, **_kwargs: Any) -> dict:
+        if self.session_id == "revoked":
+            raise RuntimeError("401 INVALID_SESSION_ID")
+        return {}
+
+    def query_all(self, soql: str) -> dict:
+        return {"totalSize": 1, "records": [{"Name": "Fake Org", "OrganizationType": "Developer Edition", "Id": "00D"}]}
+
+
+@pytest.fixture
+def soap_env(monkeypatch, tmp_path):
+    import simple_salesforce
+
+    from skills.sfdc_connect import sfdc_connect
+
+    _FakeClient.built = []
+    monkeypatch.setattr(simple_salesforce, "Salesforce", _FakeClient)
+    monkeypatch.setattr(sfdc_connect, "SESSION_CACHE_DIR", tmp_path / "sessions")
+    monkeypatch.setenv("SF_USERNAME", "test@example.com")
+    monkeypatch.setenv("SF_PASSWORD", "password")
+    monkeypatch.setenv("SF_SECURITY_TOKEN", "token")
+    monkeypatch.setenv("SF_SESSION_CACHE_TTL", "900")
+    monkeypatch.delenv("SF_API_VERSION", raising=False)
+    return tmp_path / "sessions"
+
+
+def test_connect_reuses_cached_session(soap_env):
+    """A second _connect reuses the first login's session instead of logging in again."""
+    from skills.sfdc_connect.sfdc_connect import _connect
+
+    _connect()
+    _connect()
+
+    assert "username" in _FakeClient.built[0]
+    assert _FakeClient.built[1]["session_id"] == "fresh-session"
+    assert "username" not in _FakeClient.built[1]
+    assert [kwargs["version"] for kwargs in _FakeClient.built] == ["59.0", "59.0"]
+    (cache_file,) = soap_env.iterdir()
+    assert stat.S_IMODE(cache_file.stat().st_mode) == 0o600
+
+
+def test_connect_relogs_in_when_cached_session_rejected(soap_env):
+    """A cached session the org rejects is discarded and replaced by a fresh login."""
+    from skills.sfdc_connect.sfdc_connect import _connect
+
+    _connect()
+    (cache_file,) = soap_env.iterdir()
+    entry = json.loads(cache_file.read_bytes())
+    cache_file.write_text(json.dumps({**entry, "session_id": "revoked"}))
+
+    sf = _connect()
+
+    assert sf.session_id == "fresh-session"
+    assert "username" in _FakeClient.built[-1]
+    assert json.loads(cache_file.read_bytes())["session_id"] == "fresh-session"
+
+
+def test_connect_session_cache_disabled_by_default(soap_env, monkeypatch):
+    """Without SF_SESSION_CACHE_TTL every connect logs in and nothing is written to disk."""
+    from skills.sfdc_connect.sfdc_connect import _connect
+
+    monkeypatch.delenv("SF_SESSION_CACHE_TTL")
+    _connect()
+    _connect()
+
+    assert all("username" in kwargs for kwargs in _FakeClient.built)
+    assert not soap_env.exists()
+
+
+def test_connect_ignores_cached_session_after_credential_change(soap_env, monkeypatch):
+    """A changed password maps to a different cache entry, so the stale session is not reused."""
+    from skills.sfdc_connect.sfdc_connect import _connect
+
+    _connect()
+    monkeypatch.setenv("SF_PASSWORD", "wrong-password")
+    _connect()
+
+    assert all("username" in kwargs for kwargs in _FakeClient.built)
+    assert _FakeClient.built[1]["password"] == "wrong-password"
+
+
+def test_auth_command_always_logs_in(soap_env):
+    """sfdc-connect auth verifies the credentials even when a cached session exists."""
+    from click.testing import CliRunner
+
+    from skills.sfdc_connect.sfdc_connect import _connect, cli
+
+    _connect()
+    result = CliRunner().invoke(cli, ["auth"])
+
+    assert result.exit_code == 0, result.output
+    assert "OK — connected to: Fake Org" in result.output
+    assert all("username" in kwargs for kwargs in _FakeClient.built)
@@ -0,0 +1,45 @@
+"""Unit tests for sscf-benchmark domain scoring (run_benchmark over an in-memory index and backlog)."""
+
+from __future__ import annotations
+
+from skills.sscf_benchmark.sscf_benchmark import run_benchmark
+
+_INDEX = {
+    "SSCF-IAM-001": {"domain": "identity_access_management", "title": "MFA"},
+    "SSCF-IAM-002": {"domain": "identity_access_management", "title": "Privileged access"},
+    "SSCF-LOG-001": {"domain": "logging_monitoring", "title": "Audit logging"},
+    "SSCF-DSP-001": {"domain": "data_security_privacy", "title": "Encryption"},
+}
+
+
+def _item(control_id: str, status: str, *sscf_ids: str) -> dict:
+    return {"sbs_control_id": control_id, "status": status, "sscf_control_ids": list(sscf_ids)}
+
+
+def test_domain_and_overall_scores() -> None:
+    """pass=1.0, partial=0.5, fail=0.0; not_applicable and unmapped domains are excluded from scores."""
+    backlog = {
+        "assessment_id": "unit",
+        "mapped_items": [
+            _item("SBS-AUTH-001", "pass", "SSCF-IAM-001"),
+            _item("SBS-AUTH-002", "partial", "SSCF-IAM-002"),
+            _item("SBS-ACS-001", "fail", "SSCF-IAM-002"),
+            _item("SBS-LOG-001", "not_applicable", "SSCF-LOG-001"),
+            _item("SBS-XXX-001", "fail", "SSCF-UNKNOWN-001"),
+        ],
+    }
+
+    report = run_benchmark(backlog, _INDEX, threshold=0.8)
+    domains = {d["domain"]: d for d in report["domains"]}
+
+    iam = domains["identity_access_management"]
+    assert (iam["pass"], iam["partial"], iam["fail"]) == (1, 1, 1)
+    assert iam["score"] == 0.5
+    assert iam["status"] == "amber"
+    assert domains["logging_monitoring"]["score"] is None
+    assert domains["logging_monitoring"]["status"] == "not_assessed"
+    assert domains["data_security_privacy"]["findings_count"] == 0
+
+    assert report["overall_score"] == 0.5
+    assert report["summary"]["unmatched_findings"] == 1
+    assert report["summary"]["domains_not_assessed"] == 2